@@ -4,14 +4,124 @@ https://www.api-football.com/
 """
 
 import os
+import orjson
 import requests
 import logging
-from typing import Dict, Any, Optional, List, Union
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Optional, List, Tuple, Union
 from urllib.parse import urljoin
 
+from app.models.football_data import LIVE_STATUSES
+from app.utils.cache import ResponseCache
+
 logger = logging.getLogger(__name__)
 logger.propagate = True
 
+# Cache lifetimes in seconds per endpoint; endpoints that are not listed
+# here, and live scores, are always fetched from the API
+CACHE_TTLS = {
+    "leagues": 24 * 60 * 60,
+    "teams": 24 * 60 * 60,
+    "fixtures": 5 * 60,
+    "fixtures/lineups": 24 * 60 * 60,
+    "fixtures/events": 10 * 60,
+    "fixtures/statistics": 10 * 60,
+    "standings": 5 * 60,
+    "players/topscorers": 5 * 60,
+    "players/topyellowcards": 5 * 60,
+    "players/topredcards": 5 * 60,
+    "players/topappearances": 5 * 60,
+}
+
+# Fixture listings whose matches have all finished no longer change, so
+# they are kept for a week instead of the short "fixtures" TTL
+FINISHED_FIXTURES_TTL = 7 * 24 * 60 * 60
+FINISHED_STATUSES = frozenset({"FT", "AET", "PEN"})
+
+# Fixtures in play change from minute to minute, so listings holding a live
+# match, and the events and statistics of a match that is not known to have
+# finished, are only kept for a few seconds
+LIVE_FIXTURES_TTL = 15
+FIXTURE_DETAIL_ENDPOINTS = frozenset({"fixtures/events", "fixtures/statistics"})
+
+# Most fixture IDs the API accepts in a single "ids" lookup
+MAX_FIXTURE_IDS_PER_REQUEST = 20
+
+# Upper bound on requests issued concurrently over the shared session pool
+MAX_CONCURRENT_REQUESTS = 10
+
+
+def _compact_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop query parameters that were not provided."""
+    return {key: value for key, value in params.items() if value is not None}
+
+
+def _response_ttl(endpoint: str, data: Dict[str, Any], ttl: int) -> int:
+    """
+    Get the cache lifetime for a response, adjusted for fixture status.
+
+    Fixture listings are kept for FINISHED_FIXTURES_TTL once every match has
+    finished, and only for LIVE_FIXTURES_TTL while any match is in play.
+
+    Args:
+        endpoint: API endpoint the response came from
+        data: Decoded API response
+        ttl: Default lifetime for the endpoint in seconds
+
+    Returns:
+        Cache lifetime in seconds
+    """
+    if endpoint != "fixtures":
+        return ttl
+
+    try:
+        statuses = {item["fixture"]["status"]["short"] for item in data["response"]}
+    except (KeyError, TypeError):
+        return ttl
+
+    if statuses & LIVE_STATUSES:
+        return min(ttl, LIVE_FIXTURES_TTL)
+    if statuses <= FINISHED_STATUSES:
+        return FINISHED_FIXTURES_TTL
+    return ttl
+
+
+def _filter_fixtures_by_date(
+    data: Dict[str, Any],
+    date: Optional[str] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Narrow a fixtures response down to a date or date range.
+
+    Fixture dates are ISO 8601 strings, so their first ten characters
+    (YYYY-MM-DD) are compared as strings without parsing them.
+
+    Args:
+        data: Fixtures API response
+        date: Keep fixtures on this date (YYYY-MM-DD format)
+        from_date: Keep fixtures on or after this date (YYYY-MM-DD format)
+        to_date: Keep fixtures on or before this date (YYYY-MM-DD format)
+
+    Returns:
+        Copy of the response holding only the matching fixtures
+    """
+    fixtures = []
+    for item in data.get("response", []):
+        day = (item.get("fixture", {}).get("date") or "")[:10]
+        if date and day != date:
+            continue
+        if from_date and day < from_date:
+            continue
+        if to_date and day > to_date:
+            continue
+        fixtures.append(item)
+
+    return {**data, "results": len(fixtures), "response": fixtures}
+
 
 class FootballAPIClient:
     """Client for interacting with the API-Football REST API."""
@@ -19,16 +129,41 @@ class FootballAPIClient:
     BASE_URL = os.getenv("BASE_URL", "https://v3.football.api-sports.io/")
     API_KEY = os.getenv("API_KEY")
 
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, use_cache: bool = True):
         """
         Initialize the Football API client.
 
         Args:
             api_key: API key for authentication
             timeout: Request timeout in seconds
+            use_cache: Whether to cache responses of semi-static endpoints on disk
         """
         self.api_key = self.API_KEY
         self.timeout = timeout
+        self.cache = ResponseCache() if use_cache else None
+
+        # Retry rate-limited (429) and transient server errors with exponential
+        # backoff, waiting as long as the API asks via Retry-After
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+            respect_retry_after_header=True
+        )
+
+        # Reuse pooled keep-alive connections across calls instead of paying
+        # a new TCP+TLS handshake for every endpoint request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update({"Connection": "keep-alive"})
+
+        # The API key never changes for a client, so the auth headers are
+        # built once and sent with every request by the session
+        self._headers = self._get_headers()
+        self._session.headers.update(self._headers)
 
     def _get_headers(self) -> Dict[str, str]:
         """
@@ -45,7 +180,8 @@ class FootballAPIClient:
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        method: str = "GET"
+        method: str = "GET",
+        bypass_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Make a request to the API.
@@ -54,6 +190,7 @@ class FootballAPIClient:
             endpoint: API endpoint to call
             params: Query parameters for the request
             method: HTTP method (GET, POST, etc.)
+            bypass_cache: Skip the response cache and always hit the API
 
         Returns:
             Dict containing the API response
@@ -62,37 +199,98 @@ class FootballAPIClient:
             requests.RequestException: If the request fails
         """
         url = urljoin(self.BASE_URL, endpoint)
-        headers = self._get_headers()
-        logger.info(f"URL: {url}")
-        logger.info(f"Headers: {headers}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("URL: %s", url)
+            # Mask header values so the API key never ends up in log output
+            logger.debug("Headers: %s", {key: "***" for key in self._headers})
+
+        method = method.upper()
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported method: {method}")
+
+        # Serve semi-static data from the local cache when possible
+        ttl = CACHE_TTLS.get(endpoint, 0)
+        use_cache = (
+            self.cache is not None
+            and not bypass_cache
+            and method == "GET"
+            and ttl > 0
+        )
+        if use_cache:
+            cache_key = self.cache.make_key(endpoint, params)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Cache hit for %s", endpoint)
+                return cached
 
         try:
-            if method.upper() == "GET":
-                response = requests.get(
-                    url,
-                    headers=headers,
-                    params=params,
-                    timeout=self.timeout
-                )
-            elif method.upper() == "POST":
-                response = requests.post(
-                    url,
-                    headers=headers,
-                    json=params,
-                    timeout=self.timeout
-                )
-            else:
-                raise ValueError(f"Unsupported method: {method}")
+            response = self._session.request(
+                method,
+                url,
+                params=params if method == "GET" else None,
+                json=params if method == "POST" else None,
+                timeout=self.timeout
+            )
 
             response.raise_for_status()
-            return response.json()
+            data = orjson.loads(response.content)
 
-        except requests.RequestException as e:
+            # Never cache error payloads (e.g. rate limit messages) or empty
+            # results such as lineups that have not been announced yet
+            if use_cache and not data.get("errors") and data.get("response"):
+                if endpoint in FIXTURE_DETAIL_ENDPOINTS:
+                    ttl = self._fixture_detail_ttl(params, ttl)
+                self.cache.set(cache_key, data, _response_ttl(endpoint, data, ttl))
+
+            return data
+
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"API request failed: {e}")
-            print(f"API request failed: {e}")  # Add print for debugging
             # Return an empty response for testing
             return {"results": 0, "errors": {"message": f"API request failed: {e}"}, "response": []}
 
+    def _fixture_detail_ttl(self, params: Optional[Dict[str, Any]], ttl: int) -> int:
+        """
+        Get the cache lifetime for a fixture's events or statistics.
+
+        These responses carry no match status, so the status is taken from
+        the fixture's cached lookup. Details are only kept for the endpoint's
+        full lifetime once that lookup shows the match has finished.
+
+        Args:
+            params: Query parameters of the details request
+            ttl: Default lifetime for the endpoint in seconds
+
+        Returns:
+            Cache lifetime in seconds
+        """
+        fixture = self.cache.get(self.cache.make_key("fixtures", {"id": (params or {}).get("fixture")}))
+        try:
+            finished = fixture["response"][0]["fixture"]["status"]["short"] in FINISHED_STATUSES
+        except (IndexError, KeyError, TypeError):
+            finished = False
+
+        return ttl if finished else min(ttl, LIVE_FIXTURES_TTL)
+
+    def fetch_many(
+        self,
+        specs: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Make several independent requests concurrently.
+
+        Args:
+            specs: List of (endpoint, params) pairs to request
+
+        Returns:
+            List of API responses in the same order as specs
+        """
+        if len(specs) <= 1:
+            return [self._make_request(endpoint, params) for endpoint, params in specs]
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(specs))) as executor:
+            return list(executor.map(lambda spec: self._make_request(*spec), specs))
+
     # API Methods
     def get_leagues(self, country: Optional[str] = None, season: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -105,11 +303,10 @@ class FootballAPIClient:
         Returns:
             Dict containing leagues information
         """
-        params = {}
-        if country:
-            params["country"] = country
-        if season:
-            params["season"] = season
+        params = _compact_params({
+            "country": country,
+            "season": season
+        })
 
         return self._make_request("leagues", params)
 
@@ -128,11 +325,10 @@ class FootballAPIClient:
         Returns:
             Dict containing teams information
         """
-        params = {}
-        if league:
-            params["league"] = league
-        if season:
-            params["season"] = season
+        params = _compact_params({
+            "league": league,
+            "season": season
+        })
 
         return self._make_request("teams", params)
 
@@ -163,7 +359,8 @@ class FootballAPIClient:
         timezone: Optional[str] = None,
         status: Optional[str] = None,
         round: Optional[str] = None,
-        live: Optional[str] = None
+        live: Optional[str] = None,
+        bypass_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Get fixtures information.
@@ -179,33 +376,67 @@ class FootballAPIClient:
             status: Filter by fixture status
             round: Filter by competition round
             live: Filter live matches ("all" for all live matches)
+            bypass_cache: Skip the response cache and always hit the API
 
         Returns:
             Dict containing fixtures information
         """
-        params = {}
-        if team_id:
-            params["team"] = team_id
-        if league_id:
-            params["league"] = league_id
-        if season:
-            params["season"] = season
-        if date:
-            params["date"] = date
-        if from_date:
-            params["from"] = from_date
-        if to_date:
-            params["to"] = to_date
-        if timezone:
-            params["timezone"] = timezone
-        if status:
-            params["status"] = status
-        if round:
-            params["round"] = round
-        if live:
-            params["live"] = live
-
-        return self._make_request("fixtures", params)
+        params = _compact_params({
+            "team": team_id,
+            "league": league_id,
+            "season": season,
+            "date": date,
+            "from": from_date,
+            "to": to_date,
+            "timezone": timezone,
+            "status": status,
+            "round": round,
+            "live": live
+        })
+
+        # A date-filtered listing can be answered from a cached listing of
+        # the same fixtures without a date filter, e.g. the whole season
+        if (date or from_date or to_date) and self.cache is not None and not bypass_cache:
+            undated = {key: value for key, value in params.items() if key not in ("date", "from", "to")}
+            cached = self.cache.get(self.cache.make_key("fixtures", undated))
+            if cached is not None:
+                logger.debug("Filtering cached fixtures by date")
+                return _filter_fixtures_by_date(cached, date, from_date, to_date)
+
+        return self._make_request("fixtures", params, bypass_cache=bypass_cache)
+
+    def get_fixture(self, fixture_id: int) -> Dict[str, Any]:
+        """
+        Get information for a single fixture.
+
+        Args:
+            fixture_id: ID of the fixture
+
+        Returns:
+            Dict containing the fixture information
+        """
+        return self._make_request("fixtures", {"id": fixture_id})
+
+    def get_fixtures_by_ids(self, fixture_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Get information for several fixtures, batching IDs into as few requests as possible.
+
+        Args:
+            fixture_ids: IDs of the fixtures
+
+        Returns:
+            List of API responses, one per batch of up to
+            MAX_FIXTURE_IDS_PER_REQUEST fixtures
+        """
+        batches = [
+            fixture_ids[start:start + MAX_FIXTURE_IDS_PER_REQUEST]
+            for start in range(0, len(fixture_ids), MAX_FIXTURE_IDS_PER_REQUEST)
+        ]
+
+        return self.fetch_many([
+            ("fixtures", {"ids": "-".join([str(fixture_id) for fixture_id in batch])})
+            for batch in batches
+        ])
 
     def get_live_scores(
         self,
@@ -226,7 +457,8 @@ class FootballAPIClient:
         return self.get_fixtures(
             league_id=league_id,
             timezone=timezone,
-            live="all"
+            live="all",
+            bypass_cache=True
         )
 
     def get_players(
@@ -338,13 +570,11 @@ class FootballAPIClient:
         Returns:
             Dict containing comprehensive team statistics
         """
-        params = {
+        params = _compact_params({
             "team": team,
-            "season": season
-        }
-
-        if league:
-            params["league"] = league
+            "season": season,
+            "league": league
+        })
 
         return self._make_request("teams/statistics", params)
 
@@ -414,6 +644,32 @@ class FootballAPIClient:
 
         return self._make_request("players/topredcards", params)
 
+    def get_top_cards(
+        self,
+        league_id: int,
+        season: int
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Get players with most yellow and most red cards, fetched concurrently.
+
+        Args:
+            league_id: League ID
+            season: Season year
+
+        Returns:
+            Tuple of the yellow card and red card responses
+        """
+        params = {
+            "league": league_id,
+            "season": season
+        }
+
+        yellow_response, red_response = self.fetch_many([
+            ("players/topyellowcards", params),
+            ("players/topredcards", params),
+        ])
+        return yellow_response, red_response
+
     def get_top_appearances(
         self,
         league_id: int,
@@ -461,6 +717,42 @@ class FootballAPIClient:
 
         return self._make_request("players", params)
 
+    def get_league_players_all_pages(
+        self,
+        league_id: int,
+        season: int,
+        max_pages: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get every page of players for a specific league and season.
+
+        The first page is fetched to learn the total page count, then the
+        remaining pages are requested concurrently over the pooled session.
+
+        Args:
+            league_id: League ID
+            season: Season year
+            max_pages: Maximum number of pages to fetch (all pages if None)
+
+        Returns:
+            List of page responses, ordered by page number
+        """
+        first_page = self.get_league_players(league_id=league_id, season=season, page=1)
+
+        total_pages = first_page.get("paging", {}).get("total") or 1
+        if max_pages is not None:
+            total_pages = min(total_pages, max_pages)
+
+        if total_pages <= 1:
+            return [first_page]
+
+        pages = self.fetch_many([
+            ("players", {"league": league_id, "season": season, "page": page})
+            for page in range(2, total_pages + 1)
+        ])
+
+        return [first_page] + pages
+
     def get_top_passes(
         self,
         league_id: int,
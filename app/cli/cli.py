@@ -1,35 +1,98 @@
 #!/usr/bin/env python3
 """
 Sporty CLI - Main entry point for the Sporty command-line interface.
+
+The top-level dispatcher uses argparse and imports only the click command
+that was asked for, so click and the other commands stay out of startup.
+
+Logging convention: nothing is logged at import time (this module does not
+even import logging until dispatch), and any debug call whose arguments are
+costly to build is wrapped in
+``if logger.isEnabledFor(logging.DEBUG):`` so that work is skipped unless
+--debug is passed.
 """
 
-import click
-import logging
+import argparse
+import importlib
 import sys
-import os
-
-from app.utils.error_handlers import setup_error_handling
-from app.cli.commands import (
-    matches, 
-    live, 
-    fixture_statistics, 
-    fixture_lineup, 
-    team_squad, 
-    team_history, 
-    team_stats,
-)
-# Import our new standings command
-from app.cli.commands.standings_cmd import standings
-from app.cli.commands.top_performer_cmd import top_performer
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-
-logger = logging.getLogger(__name__)
-logger.info("Logging is configured correctly.")
+
+# Registry of top-level subcommands: name -> ("module:attribute", short help)
+SUBCOMMANDS = {
+    "history": (
+        "app.cli.commands.team_history_cmd:team_history",
+        "Display past match results for a specific team.",
+    ),
+    "lineup": (
+        "app.cli.commands.lineup_cmd:fixture_lineup",
+        "Display detailed lineup information for a specific fixture.",
+    ),
+    "live": (
+        "app.cli.commands.live_cmd:live",
+        "Get live match information (alias for 'matches scores --live').",
+    ),
+    "matches": (
+        "app.cli.commands.matches_cmd:matches",
+        "Get match information.",
+    ),
+    "squad": (
+        "app.cli.commands.squad_cmd:team_squad",
+        "Display all players in a team's squad for a specific season.",
+    ),
+    "standings": (
+        "app.cli.commands.standings_cmd:standings",
+        "Get league standings information.",
+    ),
+    "stats": (
+        "app.cli.commands.stats_cmd:fixture_statistics",
+        "Display detailed statistics for a specific fixture.",
+    ),
+    "team-stats": (
+        "app.cli.commands.team_stats_cmd:team_stats",
+        "Display aggregated statistics for a team in a specific season.",
+    ),
+    "top-performer": (
+        "app.cli.commands.top_performer_cmd:top_performer",
+        "Get top performers across different metrics.",
+    ),
+}
+
+# Top-level help for the closed set of subcommands, rendered once from
+# SUBCOMMANDS; printed directly for `sporty --help` so no command module has
+# to be imported
+STATIC_HELP = """\
+Usage: sporty [OPTIONS] COMMAND [ARGS]...
+
+  Sporty CLI - Your sports companion app.
+
+Options:
+  --debug / --no-debug  Enable debug logging.
+  --help                Show this message and exit.
+
+Commands:
+""" + "\n".join([
+    f"  {name:<13}  {short_help}" for name, (_, short_help) in SUBCOMMANDS.items()
+])
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the top-level argument parser.
+
+    Returns:
+        Parser that peels off global options and the subcommand name
+    """
+    parser = argparse.ArgumentParser(
+        prog="sporty",
+        usage="sporty [OPTIONS] COMMAND [ARGS]...",
+        add_help=False
+    )
+    parser.add_argument("-h", "--help", action="store_true")
+    parser.add_argument("--debug", dest="debug", action="store_true", default=False)
+    parser.add_argument("--no-debug", dest="debug", action="store_false")
+    parser.add_argument("command", nargs="?", choices=list(SUBCOMMANDS))
+    # Everything after the subcommand name is parsed by the click command itself
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    return parser
 
 
 def main():
@@ -39,39 +102,56 @@ def main():
     This function sets up the command-line interface and handles
     command execution.
     """
-    # Set up error handling
-    setup_error_handling()
-    # Call the CLI directly
-    cli()
-
-
-@click.group()
-@click.option(
-    "--debug/--no-debug",
-    default=False,
-    help="Enable debug logging."
-)
-def cli(debug):
-    """Sporty CLI - Your sports companion app."""
-    # Set up logging based on debug flag
-    if debug:
+    # Plain top-level help is static, so answer it without building anything
+    if len(sys.argv) == 2 and sys.argv[1] in ("-h", "--help"):
+        print(STATIC_HELP)
+        return
+
+    options = _build_parser().parse_args(sys.argv[1:])
+    if options.help or options.command is None:
+        print(STATIC_HELP)
+        return
+
+    # logging is imported here rather than at module level so the help
+    # paths above never load it
+    import logging
+
+    # Configure logging only when running as a program, so importing this
+    # module as a library leaves the host's logging setup alone; only
+    # warnings and errors are shown unless --debug is passed
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.WARNING,
+            format="%(levelname)s %(name)s: %(message)s"
+        )
+    # Keep connection pool chatter out of normal CLI output
+    logging.getLogger("urllib3").setLevel(logging.WARNING)
+    if options.debug:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    # Set up error handling
-    setup_error_handling()
+    # Install the global exception hook once, before dispatching; a trailing
+    # --help only prints click's usage text, so that path skips the setup
+    if options.args[-1:] != ["--help"]:
+        from app.utils.error_handlers import setup_error_handling
+        setup_error_handling()
+
+    # Set up ANSI colour handling once per process rather than per command
+    from colorama import init
+    init()
+
+    # Import only the requested click command and let it parse its own options
+    module_name, attr_name = SUBCOMMANDS[options.command][0].rsplit(":", 1)
+    command = getattr(importlib.import_module(module_name), attr_name)
+    command.main(args=options.args, prog_name=f"sporty {options.command}")
 
 
-# Add command groups
-cli.add_command(matches)
-cli.add_command(live)
-cli.add_command(fixture_statistics, name="stats")
-cli.add_command(fixture_lineup, name="lineup")
-cli.add_command(team_squad, name="squad")
-cli.add_command(team_history, name="history")
-cli.add_command(team_stats, name="team-stats")
-cli.add_command(standings, name="standings")
-cli.add_command(top_performer, name="top-performer")
+def __getattr__(name):
+    """Expose the click group as ``cli`` without importing click eagerly."""
+    if name == "cli":
+        from app.cli.group import cli
+        return cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -1,24 +1,41 @@
 """
 CLI commands for the Sporty application.
+
+Commands are resolved on first attribute access (PEP 562) so that importing
+this package, or one command submodule, does not import every other command
+and its dependencies.
 """
 
-from app.cli.commands.matches_cmd import matches
-from app.cli.commands.live_cmd import live
-from app.cli.commands.stats_cmd import fixture_statistics
-from app.cli.commands.lineup_cmd import fixture_lineup
-from app.cli.commands.squad_cmd import team_squad
-from app.cli.commands.team_history_cmd import team_history
-from app.cli.commands.team_stats_cmd import team_stats
-from app.cli.commands.standings_cmd import standings
+import importlib
+
+# Map each exported command to the submodule that defines it
+_LAZY_COMMANDS = {
+    'matches': '.matches_cmd',
+    'live': '.live_cmd',
+    'fixture_statistics': '.stats_cmd',
+    'fixture_lineup': '.lineup_cmd',
+    'team_squad': '.squad_cmd',
+    'team_history': '.team_history_cmd',
+    'team_stats': '.team_stats_cmd',
+    'standings': '.standings_cmd',
+    'top_performer': '.top_performer_cmd',
+}
 
 # Export all command groups
-__all__ = [
-    'matches', 
-    'live', 
-    'fixture_statistics', 
-    'fixture_lineup', 
-    'team_squad',
-    'team_history',
-    'team_stats',
-    'standings'
-]
\ No newline at end of file
+__all__ = list(_LAZY_COMMANDS)
+
+
+def __getattr__(name):
+    """Import and return a command from its submodule on first access."""
+    if name not in _LAZY_COMMANDS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_COMMANDS[name], __name__)
+    command = getattr(module, name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = command
+    return command
+
+
+def __dir__():
+    """List the lazily exported commands alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
@@ -4,21 +4,86 @@ CLI commands for handling team lineup data.
 
 import click
 import logging
-from colorama import Fore, Style, init
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from colorama import Fore, Style
 from tabulate import tabulate
 
 from app.utils.error_handlers import APIError
 from app.services.football_service import FootballService
-from app.cli.commands.utils import get_position_color, display_visual_formation
+from app.cli.commands.utils import get_position_color, render_visual_formation, format_status, lineup_sort_key
 
 logger = logging.getLogger(__name__)
 
+# Reset code bound once for the per-player table cells
+_RESET = Style.RESET_ALL
+
+
+@lru_cache(maxsize=64)
+def _position_cell(position):
+    """Get the coloured table cell for a position; positions are a small, repeating set."""
+    if not position:
+        return "-"
+    return f"{get_position_color(position)}{position}{_RESET}"
+
+
+def _render_team_lineup(lineup, visual):
+    """
+    Render one team's lineup: header, optional formation, starters and substitutes.
+
+    Args:
+        lineup: TeamLineup to render
+        visual: Whether to include the visual formation
+
+    Returns:
+        The rendered lineup block
+    """
+    lines = [
+        f"{Fore.MAGENTA}{Style.BRIGHT}{lineup.team_name}{Style.RESET_ALL}",
+        f"Formation: {Fore.YELLOW}{lineup.formation}{Style.RESET_ALL}",
+        f"Coach: {lineup.coach}",
+    ]
+    out = lines.append
+    
+    # Display starting XI in a visual formation if requested
+    if visual and lineup.formation:
+        out(f"\n{Fore.GREEN}{Style.BRIGHT}Formation:{Style.RESET_ALL}")
+        out(render_visual_formation(lineup).rstrip("\n"))
+    
+    # Starting XI
+    out(f"\n{Fore.GREEN}{Style.BRIGHT}Starting XI:{Style.RESET_ALL}")
+    starters_table = []
+    for player in sorted(lineup.starters, key=lineup_sort_key):
+        # Colorize by position
+        starters_table.append([
+            f"{player.number}" if player.number else "-",
+            f"{get_position_color(player.position)}{player.name}{_RESET}",
+            _position_cell(player.position),
+            player.grid or "-"
+        ])
+    
+    out(tabulate(starters_table, headers=["#", "Player", "Position", "Grid"], tablefmt="simple"))
+    
+    # Substitutes
+    out(f"\n{Fore.YELLOW}Substitutes:{Style.RESET_ALL}")
+    subs_table = []
+    for player in sorted(lineup.substitutes, key=lineup_sort_key):
+        subs_table.append([
+            f"{player.number}" if player.number else "-",
+            f"{get_position_color(player.position)}{player.name}{_RESET}",
+            _position_cell(player.position)
+        ])
+    
+    out(tabulate(subs_table, headers=["#", "Player", "Position"], tablefmt="simple"))
+    return "\n".join(lines)
+
+
 @click.command(name="lineup")
 @click.argument("fixture_id", type=int)
 @click.option(
     "--visual/--no-visual",
-    default=True,
-    help="Display visual representation of formation."
+    default=None,
+    help="Display visual representation of formation (default: only when writing to a terminal)."
 )
 def fixture_lineup(fixture_id, visual):
     """
@@ -26,41 +91,41 @@ def fixture_lineup(fixture_id, visual):
     
     FIXTURE_ID: ID of the fixture to display lineups for
     """
-    # Initialize colorama
-    init()
+    # The pitch drawing is only useful on a terminal, so skip building it
+    # for pipes and files unless explicitly requested
+    if visual is None:
+        visual = click.get_text_stream("stdout").isatty()
+    
+    # Collect output and write it with a single echo at the end
+    lines = []
+    out = lines.append
     
     try:
         service = FootballService()
         
-        # Get lineups
-        lineups = service.get_fixture_lineups(fixture_id)
+        # Fetch the lineups and the fixture basic information concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            lineups_future = executor.submit(service.get_fixture_lineups, fixture_id)
+            fixture_future = executor.submit(service.get_fixture, fixture_id)
+        
+        lineups = lineups_future.result()
         
         if not lineups:
-            click.echo("No lineup information available for this fixture.")
+            out("No lineup information available for this fixture.")
             return
             
-        # Get the fixture basic information if possible
+        # The fixture information is optional; without it the lineups are
+        # still shown, in the order the API returned them
         try:
-            fixtures = service.get_matches(
-                league_id=None,
-                team_id=None,
-                season=None,
-                date=None,
-                from_date=None,
-                to_date=None,
-                timezone="UTC",
-                live=False
-            )
-            
-            fixture = next((f for f in fixtures if f.id == fixture_id), None)
-            if fixture:
-                match_datetime = fixture.date.strftime("%Y-%m-%d %H:%M")
-                click.echo(f"\n{Fore.YELLOW}{Style.BRIGHT}{match_datetime} - {fixture.league.name}{Style.RESET_ALL}")
-                click.echo(f"{Fore.GREEN}{fixture.home_team.name} vs {fixture.away_team.name}{Style.RESET_ALL}")
-                click.echo(f"Status: {fixture.status.long}\n")
+            fixture = fixture_future.result()
         except Exception as e:
-            # If we can't get the fixture info, just continue with lineups
-            pass
+            logger.warning("Could not fetch fixture %s: %s", fixture_id, e)
+            fixture = None
+        if fixture:
+            match_datetime = fixture.date.strftime("%Y-%m-%d %H:%M")
+            out(f"\n{Fore.YELLOW}{Style.BRIGHT}{match_datetime} - {fixture.league.name}{Style.RESET_ALL}")
+            out(f"{Fore.GREEN}{fixture.home_team.name} vs {fixture.away_team.name}{Style.RESET_ALL}")
+            out(f"Status: {format_status(fixture.status)}\n")
             
         # Display home team lineup
         home_lineup = None
@@ -81,85 +146,17 @@ def fixture_lineup(fixture_id, visual):
             if len(team_ids) >= 2:
                 away_lineup = lineups.get(team_ids[1])
                 
-        # Display home team lineup
+        # Display both team lineups
         if home_lineup:
-            click.echo(f"{Fore.MAGENTA}{Style.BRIGHT}{home_lineup.team_name}{Style.RESET_ALL}")
-            click.echo(f"Formation: {Fore.YELLOW}{home_lineup.formation}{Style.RESET_ALL}")
-            click.echo(f"Coach: {home_lineup.coach}")
-            
-            # Display starting XI in a visual formation if requested
-            if visual and home_lineup.formation:
-                click.echo(f"\n{Fore.GREEN}{Style.BRIGHT}Formation:{Style.RESET_ALL}")
-                display_visual_formation(home_lineup)
-            
-            # Starting XI
-            click.echo(f"\n{Fore.GREEN}{Style.BRIGHT}Starting XI:{Style.RESET_ALL}")
-            starters_table = []
-            for player in sorted(home_lineup.starters, key=lambda x: (x.position or "", x.name)):
-                # Colorize by position
-                position_color = get_position_color(player.position)
-                starters_table.append([
-                    f"{player.number}" if player.number else "-",
-                    f"{position_color}{player.name}{Style.RESET_ALL}",
-                    f"{position_color}{player.position}{Style.RESET_ALL}" if player.position else "-",
-                    player.grid or "-"
-                ])
-            
-            click.echo(tabulate(starters_table, headers=["#", "Player", "Position", "Grid"], tablefmt="simple"))
-            
-            # Substitutes
-            click.echo(f"\n{Fore.YELLOW}Substitutes:{Style.RESET_ALL}")
-            subs_table = []
-            for player in sorted(home_lineup.substitutes, key=lambda x: (x.position or "", x.name)):
-                position_color = get_position_color(player.position)
-                subs_table.append([
-                    f"{player.number}" if player.number else "-",
-                    f"{position_color}{player.name}{Style.RESET_ALL}",
-                    f"{position_color}{player.position}{Style.RESET_ALL}" if player.position else "-"
-                ])
-            
-            click.echo(tabulate(subs_table, headers=["#", "Player", "Position"], tablefmt="simple"))
+            out(_render_team_lineup(home_lineup, visual))
         
-        # Display away team lineup
         if away_lineup:
-            click.echo(f"\n{Fore.MAGENTA}{Style.BRIGHT}{away_lineup.team_name}{Style.RESET_ALL}")
-            click.echo(f"Formation: {Fore.YELLOW}{away_lineup.formation}{Style.RESET_ALL}")
-            click.echo(f"Coach: {away_lineup.coach}")
-            
-            # Display starting XI in a visual formation if requested
-            if visual and away_lineup.formation:
-                click.echo(f"\n{Fore.GREEN}{Style.BRIGHT}Formation:{Style.RESET_ALL}")
-                display_visual_formation(away_lineup)
-            
-            # Starting XI
-            click.echo(f"\n{Fore.GREEN}{Style.BRIGHT}Starting XI:{Style.RESET_ALL}")
-            starters_table = []
-            for player in sorted(away_lineup.starters, key=lambda x: (x.position or "", x.name)):
-                # Colorize by position
-                position_color = get_position_color(player.position)
-                starters_table.append([
-                    f"{player.number}" if player.number else "-",
-                    f"{position_color}{player.name}{Style.RESET_ALL}",
-                    f"{position_color}{player.position}{Style.RESET_ALL}" if player.position else "-",
-                    player.grid or "-"
-                ])
-            
-            click.echo(tabulate(starters_table, headers=["#", "Player", "Position", "Grid"], tablefmt="simple"))
-            
-            # Substitutes
-            click.echo(f"\n{Fore.YELLOW}Substitutes:{Style.RESET_ALL}")
-            subs_table = []
-            for player in sorted(away_lineup.substitutes, key=lambda x: (x.position or "", x.name)):
-                position_color = get_position_color(player.position)
-                subs_table.append([
-                    f"{player.number}" if player.number else "-",
-                    f"{position_color}{player.name}{Style.RESET_ALL}",
-                    f"{position_color}{player.position}{Style.RESET_ALL}" if player.position else "-"
-                ])
-            
-            click.echo(tabulate(subs_table, headers=["#", "Player", "Position"], tablefmt="simple"))
+            out(f"\n{_render_team_lineup(away_lineup, visual)}")
             
     except APIError as e:
         click.echo(f"API Error: {e.message}", err=True)
     except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
\ No newline at end of file
+        click.echo(f"Error: {str(e)}", err=True)
+    finally:
+        if lines:
+            click.echo("\n".join(lines))
@@ -4,7 +4,8 @@ CLI commands for handling live match data.
 
 import click
 import logging
-from colorama import init
+
+from app.cli.commands.matches_cmd import match_scores
 
 logger = logging.getLogger(__name__)
 
@@ -38,15 +39,24 @@ def live():
     type=click.Choice(["table", "detailed"]),
     default="table"
 )
-@click.pass_context
-def live_scores(ctx, league, country, timezone, format):
+def live_scores(league, country, timezone, format):
     """
     Display live scores for matches currently in progress.
 
     If a league ID is provided, only shows matches from that league.
     If a country is provided, shows matches from all leagues in that country.
     """
-    # This is a wrapper around matches scores --live
-    # Import match_scores here to avoid circular imports
-    from app.cli.commands.matches_cmd import match_scores
-    ctx.forward(match_scores, live=True)
\ No newline at end of file
+    # This is a wrapper around matches scores --live; call its callback
+    # directly rather than re-running click's option processing
+    match_scores.callback(
+        league=league,
+        team=None,
+        country=country,
+        date=None,
+        from_date=None,
+        to_date=None,
+        season=None,
+        live=True,
+        timezone=timezone,
+        format=format
+    )
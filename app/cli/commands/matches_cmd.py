@@ -5,11 +5,11 @@ CLI commands for handling match data.
 import click
 import logging
 from datetime import datetime
-from colorama import Fore, Style, init
+from colorama import Fore, Style
 
 from app.utils.error_handlers import APIError
 from app.services.football_service import FootballService
-from app.cli.commands.utils import display_fixtures
+from app.cli.commands.utils import display_fixtures, render_fixtures
 
 logger = logging.getLogger(__name__)
 
@@ -85,8 +85,6 @@ def match_scores(league, team, country, date, from_date, to_date, season, live,
     Defaults to showing matches from the current season.
     Use --live to show only matches currently in progress.
     """
-    # Initialize colorama
-    init()
 
     try:
         service = FootballService()
@@ -98,8 +96,10 @@ def match_scores(league, team, country, date, from_date, to_date, season, live,
         if season:
             header_parts.append(f"season {season}")
         else:
-            current_season = service.get_current_season()
-            header_parts.append(f"current season ({current_season})")
+            # Resolve the season once and pass it on, so the service
+            # does not work it out again for every league
+            season = service.get_current_season()
+            header_parts.append(f"current season ({season})")
         if date:
             header_parts.append(f"on {date}")
         elif from_date and to_date:
@@ -147,19 +147,21 @@ def match_scores(league, team, country, date, from_date, to_date, season, live,
                 click.echo("No matches found for the specified filters.")
                 return
 
-            # Display matches by league
+            # Render every league block, then write them all with one echo
+            blocks = []
             for league, fixtures in matches_by_league.items():
                 # League header
-                click.echo(
+                blocks.append(
                     f"\n{Fore.GREEN}{Style.BRIGHT}▶ {league.name} ({league.country}){Style.RESET_ALL}")
 
-                display_fixtures(fixtures, format)
+                blocks.append(render_fixtures(fixtures, format))
 
             # Summary
             total_matches = sum(len(fixtures)
                                 for fixtures in matches_by_league.values())
-            click.echo(
+            blocks.append(
                 f"\n{Fore.BLUE}{Style.BRIGHT}Total: {total_matches} matches in {len(matches_by_league)} leagues{Style.RESET_ALL}")
+            click.echo("\n".join(blocks))
 
     except APIError as e:
         click.echo(f"API Error: {e.message}", err=True)
@@ -4,12 +4,12 @@ CLI commands for handling team squad data.
 
 import click
 import logging
-from colorama import Fore, Style, init
+from colorama import Fore, Style
 from tabulate import tabulate
 
 from app.utils.error_handlers import APIError
 from app.services.football_service import FootballService
-from app.cli.commands.utils import get_position_color
+from app.cli.commands.utils import classify_position, get_position_color
 
 logger = logging.getLogger(__name__)
 
@@ -27,8 +27,6 @@ def team_squad(team_id, season):
     
     TEAM_ID: ID of the team to display squad for
     """
-    # Initialize colorama
-    init()
     
     try:
         service = FootballService()
@@ -60,12 +58,14 @@ def team_squad(team_id, season):
             return
             
         # Show total players found - debug info
-        logger.debug(f"Found {len(players)} players")
-        if logging.getLogger().isEnabledFor(logging.DEBUG):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Found %d players", len(players))
             # When in debug mode, show some details about the first player
-            if players:
-                first_player = players[0]
-                logger.debug(f"First player: ID={first_player.id}, Name={first_player.name}, Position={first_player.position}")
+            first_player = players[0]
+            logger.debug(
+                "First player: ID=%s, Name=%s, Position=%s",
+                first_player.id, first_player.name, first_player.position
+            )
             
         # Group players by position
         goalkeepers = []
@@ -75,27 +75,21 @@ def team_squad(team_id, season):
         others = []
         
         # Debug info - count positions before grouping
-        position_counts = {}
-        for player in players:
-            pos = player.position.lower() if player.position else "unknown"
-            position_counts[pos] = position_counts.get(pos, 0) + 1
-        
-        if logging.getLogger().isEnabledFor(logging.DEBUG):
-            logger.debug(f"Position counts: {position_counts}")
+        if logger.isEnabledFor(logging.DEBUG):
+            position_counts = {}
+            for player in players:
+                pos = player.position.lower() if player.position else "unknown"
+                position_counts[pos] = position_counts.get(pos, 0) + 1
+            logger.debug("Position counts: %s", position_counts)
         
+        groups = {
+            "goalkeeper": goalkeepers,
+            "defender": defenders,
+            "midfielder": midfielders,
+            "forward": forwards,
+        }
         for player in players:
-            if not player.position:
-                others.append(player)
-            elif player.position.lower() == "goalkeeper" or player.position.lower() == "gk":
-                goalkeepers.append(player)
-            elif "defender" in player.position.lower() or player.position.lower() in ["cb", "lb", "rb", "rwb", "lwb"]:
-                defenders.append(player)
-            elif "midfielder" in player.position.lower() or player.position.lower() in ["cm", "cdm", "cam", "rm", "lm", "dm", "am"]:
-                midfielders.append(player)
-            elif "forward" in player.position.lower() or "striker" in player.position.lower() or player.position.lower() in ["cf", "st", "rw", "lw"]:
-                forwards.append(player)
-            else:
-                others.append(player)
+            groups.get(classify_position(player.position), others).append(player)
         
         # Display squad by position
         if goalkeepers:
@@ -130,15 +124,13 @@ def team_squad(team_id, season):
 
 def _display_players(players):
     """Helper function to display a list of players."""
-    from tabulate import tabulate
-    
     table_data = []
     for player in sorted(players, key=lambda p: p.name):
         position_color = get_position_color(player.position)
         
         # Debug info when position is missing
-        if not player.position and logging.getLogger().isEnabledFor(logging.DEBUG):
-            logger.debug(f"Player without position: {player.id} - {player.name}")
+        if not player.position and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player without position: %s - %s", player.id, player.name)
             
         table_data.append([
             str(player.id),
@@ -8,7 +8,7 @@ import datetime
 import json
 from typing import Dict, Any, Optional, List
 from tabulate import tabulate
-from colorama import Fore, Style, init
+from colorama import Fore, Style
 
 from app.utils.error_handlers import APIError
 from app.services.football_service import FootballService
@@ -89,8 +89,6 @@ def league_standings(league, name, country, season, filter, sort_by, sort_dir, d
     Sort options let you order the table by different criteria like goals scored
     or goals conceded, in either ascending or descending order.
     """
-    # Initialize colorama
-    init()
 
     try:
         service = FootballService()
@@ -188,7 +186,7 @@ def league_standings(league, name, country, season, filter, sort_by, sort_dir, d
         table_data = []
         
         # If we have raw data and a valid filter, use it to create a filtered view
-        if standings_data and filter in ["home", "away"]:
+        if standings_data and filter in ("home", "away"):
             # Extract the standings array from the first league
             try:
                 league_data = standings_data[0].get("league", {})
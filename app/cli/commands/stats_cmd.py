@@ -4,14 +4,88 @@ CLI commands for handling match statistics data.
 
 import click
 import logging
-from colorama import Fore, Style, init
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+from operator import attrgetter
+from colorama import Fore, Style
 from tabulate import tabulate
 
 from app.utils.error_handlers import APIError
 from app.services.football_service import FootballService
+from app.cli.commands.utils import format_status, lineup_sort_key
 
 logger = logging.getLogger(__name__)
 
+# Sort keys, built once at import rather than as a lambda per sort call
+_stat_type = attrgetter("type")
+
+
+def _event_time(event):
+    """Sort key ordering events by minute, with events without a time last."""
+    return (event.time is None, event.time or 0)
+
+
+# Colour templates for event cells, filled in with the % operator per row
+_YELLOW_CARD_FMT = f"{Fore.YELLOW}%s{Style.RESET_ALL}"
+_RED_CARD_FMT = f"{Fore.RED}%s{Style.RESET_ALL}"
+_SUB_IN_FMT = f"{Fore.GREEN}IN: %s{Style.RESET_ALL}"
+_SUB_OUT_FMT = f"{Fore.RED}OUT: %s{Style.RESET_ALL}"
+
+
+def _starter_sort_key(player):
+    """Sort key ordering starters by position, grid slot, then name."""
+    return (player.position or "", player.grid or "", player.name)
+
+
+def _player_cells(player, grid=False):
+    """
+    Build the table cells for a lineup player.
+
+    Args:
+        player: LineupPlayer to show, or None for an empty row
+        grid: Whether to include the grid position column
+
+    Returns:
+        List of number, name, position (and grid) cells
+    """
+    if player is None:
+        return ["", "", "", ""] if grid else ["", "", ""]
+
+    cells = [
+        f"{player.number}" if player.number else "-",
+        player.name,
+        player.position or "-"
+    ]
+    if grid:
+        cells.append(player.grid or "-")
+    return cells
+
+
+def _side_by_side_table(home_players, away_players, team_names, grid=False):
+    """
+    Render two teams' players next to each other in a single table.
+
+    Args:
+        home_players: Players of the first team, in display order
+        away_players: Players of the second team, in display order
+        team_names: Names of the two teams, used as the player column headers
+        grid: Whether to include the grid position columns
+
+    Returns:
+        The rendered table
+    """
+    rows = [
+        _player_cells(home, grid) + _player_cells(away, grid)
+        for home, away in zip_longest(home_players, away_players)
+    ]
+
+    headers = []
+    for team_name in team_names:
+        headers += ["#", team_name, "Position"] + (["Grid"] if grid else [])
+
+    return tabulate(rows, headers=headers, tablefmt="simple", disable_numparse=True)
+
+
 @click.command(name="stats")
 @click.argument("fixture_id", type=int)
 def fixture_statistics(fixture_id):
@@ -20,56 +94,61 @@ def fixture_statistics(fixture_id):
     
     FIXTURE_ID: ID of the fixture to display statistics for
     """
-    # Initialize colorama
-    init()
+    
+    # Collect output and write it with a single echo at the end
+    lines = []
+    out = lines.append
     
     try:
         service = FootballService()
         
-        # Get the fixture data first
-        matches = service.get_matches(
-            league_id=None,
-            team_id=None,
-            season=None,
-            date=None,
-            from_date=None,
-            to_date=None,
-            timezone="UTC",
-            live=False
-        )
+        # Fetch the fixture and its statistics concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fixture_future = executor.submit(service.get_fixture, fixture_id)
+            stats_future = executor.submit(service.get_match_statistics, fixture_id)
         
-        # Find the specific fixture
-        fixture = next((f for f in matches if f.id == fixture_id), None)
+        # The fixture header is optional; without it the statistics are
+        # still shown
+        try:
+            fixture = fixture_future.result()
+        except Exception as e:
+            logger.warning("Could not fetch fixture %s: %s", fixture_id, e)
+            fixture = None
         
-        # If fixture not found by ID, try to fetch it specifically
         if not fixture:
-            click.echo(f"Fetching fixture {fixture_id}...")
+            out(f"Fixture {fixture_id} details unavailable; showing statistics only.\n")
         else:
             # Display basic fixture info
             match_datetime = fixture.date.strftime("%Y-%m-%d %H:%M")
-            click.echo(f"\n{Fore.YELLOW}{Style.BRIGHT}{match_datetime} - {fixture.league.name}{Style.RESET_ALL}")
-            click.echo(f"{Fore.GREEN}{fixture.home_team.name} {fixture.score_display} {fixture.away_team.name}{Style.RESET_ALL}")
-            click.echo(f"Status: {fixture.status.long}\n")
+            out(f"\n{Fore.YELLOW}{Style.BRIGHT}{match_datetime} - {fixture.league.name}{Style.RESET_ALL}")
+            out(f"{Fore.GREEN}{fixture.home_team.name} {fixture.score_display} {fixture.away_team.name}{Style.RESET_ALL}")
+            out(f"Status: {format_status(fixture.status)}\n")
             
         # Get comprehensive statistics
-        stats = service.get_match_statistics(fixture_id)
+        stats = stats_future.result()
         
         # 1. Display Events (Goals, Cards, Substitutions)
-        click.echo(f"{Fore.CYAN}{Style.BRIGHT}Match Events:{Style.RESET_ALL}")
+        out(f"{Fore.CYAN}{Style.BRIGHT}Match Events:{Style.RESET_ALL}")
         
         if not stats.events:
-            click.echo("No events recorded for this match.")
+            out("No events recorded for this match.")
         else:
-            # Group events by type
-            goals = [e for e in stats.events if e.type == "Goal"]
-            cards = [e for e in stats.events if e.type == "Card"]
-            subs = [e for e in stats.events if e.type == "Substitution"]
+            # Group events by type in a single pass over the events sorted
+            # by time, so every group comes out already in time order
+            events_by_type = {"Goal": [], "Card": [], "Substitution": []}
+            for event in sorted(stats.events, key=_event_time):
+                bucket = events_by_type.get(event.type)
+                if bucket is not None:
+                    bucket.append(event)
+            goals = events_by_type["Goal"]
+            cards = events_by_type["Card"]
+            subs = events_by_type["Substitution"]
             
             # Display goals
             if goals:
-                click.echo(f"\n{Fore.GREEN}Goals:{Style.RESET_ALL}")
+                out(f"\n{Fore.GREEN}Goals:{Style.RESET_ALL}")
                 goals_table = []
-                for goal in sorted(goals, key=lambda x: x.time):
+                for goal in goals:
                     assist = f" (Assist: {goal.assist_player_name})" if goal.assist_player_name else ""
                     goals_table.append([
                         f"{goal.time}'",
@@ -77,42 +156,42 @@ def fixture_statistics(fixture_id):
                         f"{goal.player_name}{assist}",
                         goal.detail
                     ])
-                click.echo(tabulate(goals_table, headers=["Time", "Team", "Scorer", "Type"], tablefmt="simple"))
+                out(tabulate(goals_table, headers=["Time", "Team", "Scorer", "Type"], tablefmt="simple", disable_numparse=True))
                 
             # Display cards
             if cards:
-                click.echo(f"\n{Fore.YELLOW}Cards:{Style.RESET_ALL}")
+                out(f"\n{Fore.YELLOW}Cards:{Style.RESET_ALL}")
                 cards_table = []
-                for card in sorted(cards, key=lambda x: x.time):
-                    card_color = Fore.YELLOW if "yellow" in card.detail.lower() else Fore.RED
+                for card in cards:
+                    card_fmt = _YELLOW_CARD_FMT if "yellow" in card.detail.lower() else _RED_CARD_FMT
                     cards_table.append([
                         f"{card.time}'",
                         card.team_name,
                         card.player_name,
-                        f"{card_color}{card.detail}{Style.RESET_ALL}"
+                        card_fmt % card.detail
                     ])
-                click.echo(tabulate(cards_table, headers=["Time", "Team", "Player", "Card"], tablefmt="simple"))
+                out(tabulate(cards_table, headers=["Time", "Team", "Player", "Card"], tablefmt="simple", disable_numparse=True))
                 
             # Display substitutions
             if subs:
-                click.echo(f"\n{Fore.BLUE}Substitutions:{Style.RESET_ALL}")
+                out(f"\n{Fore.BLUE}Substitutions:{Style.RESET_ALL}")
                 subs_table = []
-                for sub in sorted(subs, key=lambda x: x.time):
+                for sub in subs:
                     # For substitutions, the comment typically contains the player going out
                     player_out = sub.comments or "Unknown"
                     subs_table.append([
                         f"{sub.time}'",
                         sub.team_name,
-                        f"{Fore.GREEN}IN: {sub.player_name}{Style.RESET_ALL}",
-                        f"{Fore.RED}OUT: {player_out}{Style.RESET_ALL}"
+                        _SUB_IN_FMT % sub.player_name,
+                        _SUB_OUT_FMT % player_out
                     ])
-                click.echo(tabulate(subs_table, headers=["Time", "Team", "In", "Out"], tablefmt="simple"))
+                out(tabulate(subs_table, headers=["Time", "Team", "In", "Out"], tablefmt="simple", disable_numparse=True))
         
         # 2. Display Team Statistics
-        click.echo(f"\n{Fore.CYAN}{Style.BRIGHT}Team Statistics:{Style.RESET_ALL}")
+        out(f"\n{Fore.CYAN}{Style.BRIGHT}Team Statistics:{Style.RESET_ALL}")
         
         if not stats.team_statistics:
-            click.echo("No team statistics available for this match.")
+            out("No team statistics available for this match.")
         else:
             # Get both teams' statistics
             teams = list(stats.team_statistics.values())
@@ -120,75 +199,83 @@ def fixture_statistics(fixture_id):
                 # Create a side-by-side comparison
                 stats_table = []
                 
-                # Get all unique stat types from both teams
-                stat_types = set()
-                for team in teams:
-                    for stat in team.statistics:
-                        stat_types.add(stat.type)
+                # Index each team's statistics by type once
+                stat_maps = [
+                    {stat.type: str(stat.value) for stat in team.statistics}
+                    for team in teams
+                ]
                 
-                # Sort stat types for consistent display
-                sorted_stat_types = sorted(stat_types)
-                
-                # Create the side-by-side comparison
-                for stat_type in sorted_stat_types:
-                    row = [stat_type]
-                    
-                    for team in teams:
-                        # Find this statistic for this team
-                        team_stat = next((s for s in team.statistics if s.type == stat_type), None)
-                        if team_stat:
-                            row.append(str(team_stat.value))
-                        else:
-                            row.append("N/A")
-                    
-                    stats_table.append(row)
+                # Create the side-by-side comparison, sorted by stat type
+                for stat_type in sorted(set().union(*stat_maps)):
+                    stats_table.append(
+                        [stat_type] + [stat_map.get(stat_type, "N/A") for stat_map in stat_maps]
+                    )
                 
                 # Display the table
-                click.echo(tabulate(stats_table, headers=["Statistic", teams[0].team_name, teams[1].team_name], tablefmt="simple"))
+                out(tabulate(stats_table, headers=["Statistic", teams[0].team_name, teams[1].team_name], tablefmt="simple", disable_numparse=True))
             else:
                 # Display stats for each team individually
                 for team in teams:
-                    click.echo(f"\n{Fore.GREEN}{team.team_name}:{Style.RESET_ALL}")
+                    out(f"\n{Fore.GREEN}{team.team_name}:{Style.RESET_ALL}")
                     stats_table = []
-                    for stat in sorted(team.statistics, key=lambda x: x.type):
+                    for stat in sorted(team.statistics, key=_stat_type):
                         stats_table.append([stat.type, stat.value])
-                    click.echo(tabulate(stats_table, headers=["Statistic", "Value"], tablefmt="simple"))
+                    out(tabulate(stats_table, headers=["Statistic", "Value"], tablefmt="simple", disable_numparse=True))
         
         # 3. Display Lineups
-        click.echo(f"\n{Fore.CYAN}{Style.BRIGHT}Team Lineups:{Style.RESET_ALL}")
+        out(f"\n{Fore.CYAN}{Style.BRIGHT}Team Lineups:{Style.RESET_ALL}")
         
         if not stats.lineups:
-            click.echo("No lineup information available for this match.")
+            out("No lineup information available for this match.")
         else:
-            for team_id, lineup in stats.lineups.items():
-                click.echo(f"\n{Fore.GREEN}{lineup.team_name}{Style.RESET_ALL}")
-                click.echo(f"Formation: {lineup.formation}")
-                click.echo(f"Coach: {lineup.coach}\n")
+            lineups = list(stats.lineups.values())
+            for lineup in lineups:
+                out(f"\n{Fore.GREEN}{lineup.team_name}{Style.RESET_ALL}")
+                out(f"Formation: {lineup.formation}")
+                out(f"Coach: {lineup.coach}")
+            
+            if len(lineups) == 2:
+                # Show both teams side by side, one table per section
+                home, away = lineups
                 
                 # Starting XI
-                click.echo(f"{Fore.YELLOW}Starting XI:{Style.RESET_ALL}")
-                starters_table = []
-                for player in sorted(lineup.starters, key=lambda x: (x.position or "", x.grid or "", x.name)):
-                    starters_table.append([
-                        f"{player.number}" if player.number else "-",
-                        player.name,
-                        player.position or "-",
-                        player.grid or "-"
-                    ])
-                click.echo(tabulate(starters_table, headers=["#", "Player", "Position", "Grid"], tablefmt="simple"))
+                out(f"\n{Fore.YELLOW}Starting XI:{Style.RESET_ALL}")
+                out(_side_by_side_table(
+                    sorted(home.starters, key=_starter_sort_key),
+                    sorted(away.starters, key=_starter_sort_key),
+                    [home.team_name, away.team_name],
+                    grid=True
+                ))
                 
                 # Substitutes
-                click.echo(f"\n{Fore.YELLOW}Substitutes:{Style.RESET_ALL}")
-                subs_table = []
-                for player in sorted(lineup.substitutes, key=lambda x: (x.position or "", x.name)):
-                    subs_table.append([
-                        f"{player.number}" if player.number else "-",
-                        player.name,
-                        player.position or "-"
-                    ])
-                click.echo(tabulate(subs_table, headers=["#", "Player", "Position"], tablefmt="simple"))
+                out(f"\n{Fore.YELLOW}Substitutes:{Style.RESET_ALL}")
+                out(_side_by_side_table(
+                    sorted(home.substitutes, key=lineup_sort_key),
+                    sorted(away.substitutes, key=lineup_sort_key),
+                    [home.team_name, away.team_name]
+                ))
+            else:
+                for lineup in lineups:
+                    # Starting XI
+                    out(f"\n{Fore.YELLOW}{lineup.team_name} Starting XI:{Style.RESET_ALL}")
+                    starters_table = [
+                        _player_cells(player, grid=True)
+                        for player in sorted(lineup.starters, key=_starter_sort_key)
+                    ]
+                    out(tabulate(starters_table, headers=["#", "Player", "Position", "Grid"], tablefmt="simple", disable_numparse=True))
+                    
+                    # Substitutes
+                    out(f"\n{Fore.YELLOW}{lineup.team_name} Substitutes:{Style.RESET_ALL}")
+                    subs_table = [
+                        _player_cells(player)
+                        for player in sorted(lineup.substitutes, key=lineup_sort_key)
+                    ]
+                    out(tabulate(subs_table, headers=["#", "Player", "Position"], tablefmt="simple", disable_numparse=True))
         
     except APIError as e:
         click.echo(f"API Error: {e.message}", err=True)
     except Exception as e:
-        click.echo(f"Error: {str(e)}", err=True)
\ No newline at end of file
+        click.echo(f"Error: {str(e)}", err=True)
+    finally:
+        if lines:
+            click.echo("\n".join(lines))
@@ -5,7 +5,7 @@ CLI commands for fetching team match history.
 import click
 import logging
 from datetime import datetime, timedelta
-from colorama import Fore, Style, init
+from colorama import Fore, Style
 from tabulate import tabulate
 
 from app.utils.error_handlers import APIError
@@ -60,8 +60,6 @@ def team_history(team_id, days, from_date, to_date, season, format, timezone, li
     
     TEAM_ID: ID of the team to display history for
     """
-    # Initialize colorama
-    init()
     
     try:
         service = FootballService()
@@ -4,7 +4,7 @@ CLI commands for fetching team season statistics.
 
 import click
 import logging
-from colorama import Fore, Style, init
+from colorama import Fore, Style
 from tabulate import tabulate
 
 from app.utils.error_handlers import APIError
@@ -37,8 +37,6 @@ def team_stats(team_id, season, league, include_live):
     
     TEAM_ID: ID of the team to display statistics for
     """
-    # Initialize colorama
-    init()
     
     try:
         service = FootballService()
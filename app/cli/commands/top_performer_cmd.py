@@ -6,7 +6,7 @@ import click
 import logging
 from typing import Optional, Dict, Any, List
 from tabulate import tabulate
-from colorama import Fore, Style, init as colorama_init
+from colorama import Fore, Style
 
 from app.services.football_service import FootballService
 from app.utils.error_handlers import APIError
@@ -62,8 +62,6 @@ def top_goal_scorers(league: int, season: Optional[int], limit: int, detailed: b
     # Show detailed information for top goal scorers
     sporty top-performer goals --league 39 --detailed
     """
-    # Initialize colorama
-    colorama_init()
 
     try:
         service = FootballService()
@@ -107,8 +105,6 @@ def display_top_scorers(top_scorers: List[Dict[str, Any]], detailed: bool = Fals
         top_scorers: List of top scorer data from API
         detailed: Whether to show detailed information
     """
-    # Initialize colorama
-    colorama_init()
 
     if not top_scorers:
         click.echo(f"{Fore.YELLOW}No data available.{Style.RESET_ALL}")
@@ -233,8 +229,6 @@ def top_assisters(league: int, season: Optional[int], limit: int, detailed: bool
     # Show detailed information for top assisters
     sporty top-performer assists --league 39 --detailed
     """
-    # Initialize colorama
-    colorama_init()
 
     try:
         service = FootballService()
@@ -287,8 +281,6 @@ def display_top_assisters(top_assisters: List[Dict[str, Any]], detailed: bool =
         top_assisters: List of top assister data from API
         detailed: Whether to show detailed information
     """
-    # Initialize colorama
-    colorama_init()
 
     if not top_assisters:
         click.echo(f"{Fore.YELLOW}No data available.{Style.RESET_ALL}")
@@ -423,8 +415,6 @@ def top_cards(league: int, season: Optional[int], card_type: str, limit: int, de
     # Show detailed information for top 5 carded players in La Liga (league ID 140) for 2022 season
     sporty top-performer cards --league 140 --season 2022 --limit 5 --detailed
     """
-    # Initialize colorama
-    colorama_init()
 
     try:
         service = FootballService()
@@ -507,8 +497,6 @@ def display_top_cards(top_cards_data: List[Dict[str, Any]], card_type: str = "bo
         card_type: Type of card to display ("yellow", "red", or "both")
         detailed: Whether to show detailed information
     """
-    # Initialize colorama
-    colorama_init()
 
     if not top_cards_data:
         click.echo(f"{Fore.YELLOW}No data available.{Style.RESET_ALL}")
@@ -679,8 +667,6 @@ def top_appearances(league: int, season: Optional[int], limit: int, detailed: bo
     # Show top 5 players with most appearances for La Liga (league ID 140) in 2022 season with detailed info
     sporty top-performer appearances --league 140 --season 2022 --limit 5 --detailed
     """
-    # Initialize colorama
-    colorama_init()
 
     try:
         service = FootballService()
@@ -735,8 +721,6 @@ def display_most_appearances(appearances_data: List[Dict[str, Any]], detailed: b
         appearances_data: List of player data with appearance statistics
         detailed: Whether to show detailed information
     """
-    # Initialize colorama
-    colorama_init()
 
     if not appearances_data:
         click.echo(f"{Fore.YELLOW}No data available.{Style.RESET_ALL}")
@@ -878,8 +862,6 @@ def most_passes(league: int, season: Optional[int], limit: int, detailed: bool,
     # Show only players with at least 80% pass accuracy
     sporty top-performer passes --league 39 --min-accuracy 80
     """
-    # Initialize colorama
-    colorama_init()
 
     try:
         service = FootballService()
@@ -954,8 +936,6 @@ def display_most_passes(passing_data: List[Dict[str, Any]], detailed: bool = Fal
         passing_data: List of player data with passing statistics
         detailed: Whether to show detailed information
     """
-    # Initialize colorama
-    colorama_init()
 
     if not passing_data:
         click.echo(f"{Fore.YELLOW}No data available.{Style.RESET_ALL}")
@@ -3,243 +3,413 @@ Utility functions for CLI commands.
 """
 
 import click
+import io
+import shutil
+from functools import lru_cache
+from operator import attrgetter
 from colorama import Fore, Style
 from tabulate import tabulate
 
-def get_position_color(position):
-    """Get color based on player position."""
+# ANSI codes bound once for the hot display paths (formation slots, table cells)
+_BLU = Fore.BLUE
+_GRN = Fore.GREEN
+_RED = Fore.RED
+_YEL = Fore.YELLOW
+_RST = Style.RESET_ALL
+
+
+def lineup_sort_key(player):
+    """Sort key ordering lineup players by position, then name."""
+    return (player.position or "", player.name)
+
+
+# Line for exact position codes (lower case), including the single-letter
+# G/D/M/F codes used in fixture lineups
+_POSITION_LINES = {
+    **dict.fromkeys(("g", "gk"), "goalkeeper"),
+    **dict.fromkeys(("d", "cb", "rb", "lb", "rwb", "lwb"), "defender"),
+    **dict.fromkeys(("m", "cm", "cdm", "cam", "rm", "lm", "dm", "am"), "midfielder"),
+    **dict.fromkeys(("f", "cf", "st", "rw", "lw"), "forward"),
+}
+
+# Lines for full position names, checked as substrings in this order
+_POSITION_SUBSTRINGS = (
+    ("goalkeeper", "goalkeeper"),
+    ("defender", "defender"),
+    ("midfielder", "midfielder"),
+    ("forward", "forward"),
+    ("striker", "forward"),
+    ("attacker", "forward"),
+)
+
+# Colour for each line
+_LINE_COLORS = {
+    "goalkeeper": _YEL,
+    "defender": _BLU,
+    "midfielder": _GRN,
+    "forward": _RED,
+}
+
+
+@lru_cache(maxsize=64)
+def classify_position(position):
+    """
+    Get the line of the team a position belongs to.
+
+    Args:
+        position: Position code (e.g. "CB", "G") or name (e.g. "Defender")
+
+    Returns:
+        "goalkeeper", "defender", "midfielder" or "forward", or None if the
+        position is missing or unknown
+    """
     if not position:
-        return ""
-        
+        return None
+
     position = position.lower()
-    
-    if "goalkeeper" in position or "gk" == position:
-        return Fore.YELLOW
-    elif "defender" in position or position in ["cb", "rb", "lb", "rwb", "lwb"]:
-        return Fore.BLUE
-    elif "midfielder" in position or position in ["cm", "cdm", "cam", "rm", "lm"]:
-        return Fore.GREEN
-    elif "forward" in position or "striker" in position or position in ["cf", "st", "rw", "lw"]:
-        return Fore.RED
-    else:
-        return ""
+    line = _POSITION_LINES.get(position)
+    if line is not None:
+        return line
 
-def display_visual_formation(lineup):
-    """Display a visual representation of the team formation."""
+    return next((line for name, line in _POSITION_SUBSTRINGS if name in position), None)
+
+
+def get_position_color(position):
+    """Get color based on player position."""
+    return _LINE_COLORS.get(classify_position(position), "")
+
+# Row labels and colours for the formation view: defenders, midfielders, forwards
+_ROW_LABELS = (
+    ("Defenders", _BLU),
+    ("Midfielders", _GRN),
+    ("Forwards", _RED),
+)
+
+
+# Index into _ROW_LABELS for each outfield line returned by classify_position
+_LINE_INDEX = {"defender": 0, "midfielder": 1, "forward": 2}
+
+
+@lru_cache(maxsize=64)
+def _grid_cell(grid):
+    """
+    Parse an API grid position such as "2:3" into (row, column).
+
+    Args:
+        grid: Grid position string, where row 1 is the goalkeeper
+
+    Returns:
+        Tuple of (row, column), or None if the grid is missing or malformed
+    """
+    try:
+        row, column = grid.split(":")
+        return int(row), int(column)
+    except (AttributeError, ValueError):
+        return None
+
+
+def _grid_column(player):
+    """Sort key ordering players within a formation row by grid column."""
+    return _grid_cell(player.grid)[1]
+
+
+def _center_colored(text, width, color):
+    """Center plain text in width columns, then wrap the text itself in color."""
+    return text.center(width).replace(text, f"{color}{text}{_RST}", 1)
+
+
+def _fit_name(name, cap=15):
+    """Truncate a name to at most cap characters, marking cuts with ".."."""
+    return name if len(name) <= cap else f"{name[:cap - 2]}.."
+
+
+@lru_cache(maxsize=32)
+def _parse_formation(formation):
+    """
+    Parse a formation string such as "4-3-3" into its rows.
+
+    Args:
+        formation: Formation string from the API
+
+    Returns:
+        Tuple of (player counts, line indexes) per row, where the line index
+        is 0 for defenders, 1 for midfielders and 2 for forwards
+
+    Raises:
+        ValueError: If a part of the formation is not a number
+    """
+    counts = tuple(int(part) for part in formation.split("-"))
+    lines = [1] * len(counts)
+    lines[-1] = 2
+    lines[0] = 0
+    return counts, tuple(lines)
+
+
+# Preferred and minimum widths, in columns, of the formation view
+_FORMATION_WIDTH = 60
+_MIN_FORMATION_WIDTH = 40
+
+
+@lru_cache(maxsize=1)
+def _formation_width():
+    """Get the formation view width: the terminal width, capped at _FORMATION_WIDTH."""
+    return min(_FORMATION_WIDTH, shutil.get_terminal_size().columns)
+
+
+def render_visual_formation(lineup):
+    """
+    Render a visual representation of the team formation.
+
+    Args:
+        lineup: TeamLineup to draw
+
+    Returns:
+        The formation block as a newline-terminated string, a one-line notice
+        if it cannot be drawn, or "" if the lineup has no formation
+    """
     if not lineup.formation:
-        return
+        return ""
+
+    width = _formation_width()
+    if width < _MIN_FORMATION_WIDTH:
+        return "Terminal too narrow for formation view\n"
         
+    # Parse formation; this is the only step that depends on malformed API data
     try:
-        # Parse formation
-        formation_parts = lineup.formation.split("-")
-        if not formation_parts:
-            return
-            
-        # Create a mapping of positions to players
-        position_players = {}
-        for player in lineup.starters:
-            if player.grid:
-                position_players[player.grid] = player
-        
-        # Defense line
-        positions = len(formation_parts)
-        width = 60  # Terminal width for the formation display
+        formation_parts, row_lines = _parse_formation(lineup.formation)
+    except ValueError:
+        return f"Could not display visual formation: unrecognised formation {lineup.formation!r}\n"
         
-        # Create the pitch representation
-        lines = []
+    # Create the pitch representation in a single string buffer
+    buf = io.StringIO()
+    write = buf.write
+    
+    # Assign every starter to a formation row in a single pass. The grid
+    # row places a player directly; starters without a usable grid are
+    # kept per line and fill the rows of that line that have room left
+    goalkeeper = None
+    rows = [[] for _ in formation_parts]
+    ungridded = ([], [], [])
+    for player in lineup.starters:
+        cell = _grid_cell(player.grid)
+        if cell is not None and 1 < cell[0] <= len(rows) + 1:
+            rows[cell[0] - 2].append(player)
+            continue
+        line = classify_position(player.position)
+        if (cell is not None and cell[0] == 1) or line == "goalkeeper":
+            if goalkeeper is None:
+                goalkeeper = player
+        elif line is not None:
+            ungridded[_LINE_INDEX[line]].append(player)
+
+    # Add goalkeeper
+    write(_center_colored("(GK)", width, _YEL))
+    write("\n")
+    if goalkeeper:
+        write(_center_colored(_fit_name(goalkeeper.name, 20), width, _YEL))
+        write("\n")
         
-        # Add goalkeeper
-        gk_line = " " * (width // 2 - 5) + f"{Fore.YELLOW}(GK){Style.RESET_ALL}" + " " * (width // 2 - 5)
-        lines.append(gk_line)
+    write("\n")  # Space
+
+    # Order gridded rows left to right and ungridded players by name
+    for row in rows:
+        row.sort(key=_grid_column)
+    for bucket in ungridded:
+        bucket.sort(key=attrgetter("name"))
+
+    # Add remaining lines based on formation; row_lines index into
+    # _ROW_LABELS and ungridded. Several rows can share a line (e.g. both
+    # midfield rows of a 4-2-3-1), so keep how far each line has been used
+    taken = [0] * len(ungridded)
+    for row, count, line in zip(rows, formation_parts, row_lines):
+        # Position name, centered before it is coloured
+        label, label_color = _ROW_LABELS[line]
+        write(_center_colored(label, width, label_color))
+        write("\n")
         
-        # Find goalkeeper
-        goalkeeper = next((p for p in lineup.starters if p.position and ("goalkeeper" in p.position.lower() or "gk" == p.position.lower())), None)
-        if goalkeeper:
-            gk_name = goalkeeper.name if len(goalkeeper.name) <= 20 else goalkeeper.name[:18] + ".."
-            gk_line = " " * (width // 2 - len(gk_name) // 2) + f"{Fore.YELLOW}{gk_name}{Style.RESET_ALL}" + " " * (width // 2 - len(gk_name) // 2)
-            lines.append(gk_line)
+        # Space
+        write("\n")
             
-        lines.append("")  # Space
-        
-        # Add remaining lines based on formation
-        player_lines = []
+        # Find players for this line, limited to the formation count
+        players_in_line = row[:count]
+        free = count - len(players_in_line)
+        if free > 0:
+            start = taken[line]
+            players_in_line += ungridded[line][start:start + free]
+            taken[line] = start + free
         
-        # For each line in the formation
-        for i, count in enumerate(formation_parts):
-            count = int(count)
-            line = []
-            
-            # Position name
-            position_name = ""
-            if i == 0:
-                position_name = f"{Fore.BLUE}Defenders{Style.RESET_ALL}"
-            elif i == len(formation_parts) - 1:
-                position_name = f"{Fore.RED}Forwards{Style.RESET_ALL}"
-            else:
-                position_name = f"{Fore.GREEN}Midfielders{Style.RESET_ALL}"
-                
-            # Center the position name
-            position_line = " " * (width // 2 - len(position_name) // 2 - 10) + position_name + " " * (width // 2 - len(position_name) // 2 - 10)
-            player_lines.append(position_line)
+        # Add players to the line; everyone in a line shares its colour, so
+        # the row is coloured once instead of once per player slot
+        if players_in_line:
+            segment_width = width // (len(players_in_line) + 1)
+            player_slots = [label_color]
             
-            # Space
-            player_lines.append("")
+            for player in players_in_line:
+                number = f"({player.number})" if player.number else ""
+                player_text = f"{_fit_name(player.name)} {number}"
                 
-            # Find players for this line
-            players_in_line = []
-            for player in lineup.starters:
-                if not player.position:
-                    continue
-                    
-                position = player.position.lower()
+                # Center in the slot
+                player_slots.append(player_text.center(segment_width))
                 
-                # Check if player belongs to this formation line
-                if i == 0 and ("defender" in position or position in ["cb", "rb", "lb", "rwb", "lwb"]):
-                    players_in_line.append(player)
-                elif i == len(formation_parts) - 1 and ("forward" in position or "striker" in position or position in ["cf", "st", "rw", "lw"]):
-                    players_in_line.append(player)
-                elif i > 0 and i < len(formation_parts) - 1 and ("midfielder" in position or position in ["cm", "cdm", "cam", "rm", "lm"]):
-                    players_in_line.append(player)
-            
-            # Sort players by grid position if available, otherwise by name
-            players_in_line.sort(key=lambda x: x.grid if x.grid else x.name)
+            player_slots.append(_RST)
+            player_slots.append("\n")
+            write("".join(player_slots))
             
-            # Limit to formation count
-            players_in_line = players_in_line[:count]
-            
-            # Add players to the line
-            if players_in_line:
-                segment_width = width // (len(players_in_line) + 1)
-                player_slots = []
-                
-                for j, player in enumerate(players_in_line):
-                    position_color = get_position_color(player.position)
-                    number = f"({player.number})" if player.number else ""
-                    player_name = player.name if len(player.name) <= 15 else player.name[:13] + ".."
-                    player_text = f"{position_color}{player_name} {number}{Style.RESET_ALL}"
-                    
-                    # Center in the slot
-                    slot = " " * (segment_width // 2 - len(player_name) // 2) + player_text + " " * (segment_width // 2 - len(player_name) // 2)
-                    player_slots.append(slot)
-                    
-                player_lines.append("".join(player_slots))
-                
-            player_lines.append("")  # Space
-            
-        # Add the player lines
-        lines.extend(player_lines)
+        write("\n")  # Space
         
-        # Output the formation
-        for line in lines:
-            click.echo(line)
-            
-    except Exception as e:
-        # If any error occurs, just skip the visual representation
-        click.echo(f"Could not display visual formation: {e}")
-        return
+    return buf.getvalue()
 
-def display_fixtures(fixtures, format):
-    """Helper function to display fixtures."""
+
+def display_visual_formation(lineup):
+    """Display a visual representation of the team formation."""
+    click.echo(render_visual_formation(lineup), nl=False)
+
+# Rule printed after each fixture in the detailed view
+_FIXTURE_SEPARATOR = "-" * 50
+
+# Score breakdowns shown in the detailed format, as (Score attribute, label)
+_SCORE_DETAILS = (
+    ("halftime", "Halftime"),
+    ("fulltime", "Fulltime"),
+    ("extratime", "Extra Time"),
+    ("penalty", "Penalties"),
+)
+
+# Fixture tables longer than this are rendered in tabulate's "plain" format
+_LARGE_TABLE_ROWS = 200
+
+# Match status groups used to colour fixture statuses
+_LIVE_STATUSES = frozenset({"1H", "2H", "ET"})
+_BREAK_STATUSES = frozenset({"HT", "BT"})
+_PROBLEM_STATUSES = frozenset({"PST", "CANC", "ABD", "SUSP"})
+
+# Colour for each match status; anything else is shown in white
+_STATUS_COLOR = {
+    **dict.fromkeys(_LIVE_STATUSES, Fore.GREEN),  # Live match
+    **dict.fromkeys(_BREAK_STATUSES, Fore.YELLOW),  # Break time
+    "FT": Fore.BLUE,  # Finished
+    **dict.fromkeys(_PROBLEM_STATUSES, Fore.RED),  # Problem with match
+    "NS": Fore.CYAN,  # Not started yet
+}
+
+# Statuses for which the elapsed minutes are not shown
+_ELAPSED_HIDE = frozenset({"NS", "FT"}) | _PROBLEM_STATUSES
+
+
+def _status_cell(status):
+    """
+    Get the colour and short display text for a fixture status.
+
+    Args:
+        status: FixtureStatus of the fixture
+
+    Returns:
+        Tuple of (colour, status text with elapsed minutes where relevant)
+    """
+    short = status.short
+    status_display = short
+    if status.elapsed is not None and short not in _ELAPSED_HIDE:
+        status_display = f"{short} {status.elapsed}'"
+    return _STATUS_COLOR.get(short, Fore.WHITE), status_display
+
+
+def format_status(status):
+    """
+    Format a fixture status for display, e.g. "Second Half (2H 67')", coloured by status.
+
+    Args:
+        status: FixtureStatus of the fixture
+
+    Returns:
+        Coloured status text
+    """
+    status_color, status_display = _status_cell(status)
+    return f"{status_color}{status.long} ({status_display}){_RST}"
+
+
+def _maybe_green(team):
+    """Highlight a team name in green if the team won the match."""
+    return f"{_GRN}{team.name}{_RST}" if team.winner else team.name
+
+
+def _fixture_row(fixture):
+    """
+    Build the table row for a fixture.
+
+    Args:
+        fixture: Fixture to display
+
+    Returns:
+        Tuple of (time, status, home team, score, away team) cells
+    """
+    # Status color and display with elapsed time if applicable
+    status_color, status_display = _status_cell(fixture.status)
+
+    kickoff = fixture.date
+    return (
+        f"{kickoff.hour:02d}:{kickoff.minute:02d}",
+        f"{status_color}{status_display}{_RST}",
+        _maybe_green(fixture.home_team),
+        fixture.score_display,
+        _maybe_green(fixture.away_team)
+    )
+
+
+def render_fixtures(fixtures, format):
+    """
+    Render fixtures as a table or as detailed per-match blocks.
+
+    Args:
+        fixtures: Fixtures to show
+        format: "table" for one row per fixture, anything else for details
+
+    Returns:
+        The rendered fixtures, without a trailing newline
+    """
     if format == "table":
         # Prepare table data
-        table_data = []
-        for fixture in fixtures:
-            # Set status color based on match status
-            if fixture.status.short in ["1H", "2H", "ET"]:
-                status_color = Fore.GREEN  # Live match
-            elif fixture.status.short in ["HT", "BT"]:
-                status_color = Fore.YELLOW  # Break time
-            elif fixture.status.short == "FT":
-                status_color = Fore.BLUE  # Finished
-            elif fixture.status.short in ["PST", "CANC", "ABD", "SUSP"]:
-                status_color = Fore.RED  # Problem with match
-            elif fixture.status.short == "NS":
-                status_color = Fore.CYAN  # Not started yet
-            else:
-                status_color = Fore.WHITE  # Other status
-
-            # Prepare the status display with elapsed time if applicable
-            status_display = fixture.status.short
-            if fixture.status.elapsed is not None and fixture.status.short not in ["NS", "FT", "PST", "CANC", "ABD", "SUSP"]:
-                status_display = f"{status_display} {fixture.status.elapsed}'"
-
-            # Format match time
-            match_time = fixture.date.strftime("%H:%M")
-
-            # Add row to table data
-            table_data.append([
-                match_time,
-                f"{status_color}{status_display}{Style.RESET_ALL}",
-                Fore.GREEN + fixture.home_team.name +
-                Style.RESET_ALL if fixture.home_team.winner else fixture.home_team.name,
-                fixture.score_display,
-                Fore.GREEN + fixture.away_team.name +
-                Style.RESET_ALL if fixture.away_team.winner else fixture.away_team.name
-            ])
-
-        # Display table
+        table_data = [_fixture_row(fixture) for fixture in fixtures]
+
+        # Display table; every cell is already a string, so skip number
+        # parsing, and drop the ruled layout for very long listings
         headers = ["Time", "Status", "Home Team", "Score", "Away Team"]
-        click.echo(tabulate(table_data, headers=headers, tablefmt="simple"))
+        tablefmt = "plain" if len(table_data) > _LARGE_TABLE_ROWS else "simple"
+        return tabulate(table_data, headers=headers, tablefmt=tablefmt, disable_numparse=True)
     else:
-        # Detailed format
+        # Detailed format; every fixture block is collected and joined once
+        lines = []
         for fixture in fixtures:
-            # Set status color based on match status
-            if fixture.status.short in ["1H", "2H", "ET"]:
-                status_color = Fore.GREEN  # Live match
-            elif fixture.status.short in ["HT", "BT"]:
-                status_color = Fore.YELLOW  # Break time
-            elif fixture.status.short == "FT":
-                status_color = Fore.BLUE  # Finished
-            elif fixture.status.short in ["PST", "CANC", "ABD", "SUSP"]:
-                status_color = Fore.RED  # Problem with match
-            elif fixture.status.short == "NS":
-                status_color = Fore.CYAN  # Not started yet
-            else:
-                status_color = Fore.WHITE  # Other status
-
-            # Format date and time
-            match_datetime = fixture.date.strftime("%Y-%m-%d %H:%M")
+            # Format date and time (equivalent to strftime("%Y-%m-%d %H:%M"))
+            d = fixture.date
+            match_datetime = f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}"
 
             # Venue and referee info if available
             venue_info = f" at {fixture.venue}" if fixture.venue else ""
             referee_info = f" (Referee: {fixture.referee})" if fixture.referee else ""
 
-            # Status display
-            status_display = fixture.status.short
-            if fixture.status.elapsed is not None and fixture.status.short not in ["NS", "FT", "PST", "CANC", "ABD", "SUSP"]:
-                status_display = f"{status_display} {fixture.status.elapsed}'"
-
-            # Print header with match info
-            click.echo(f"\n{Fore.YELLOW}{Style.BRIGHT}{match_datetime}{Style.RESET_ALL}")
-            click.echo(
-                f"{fixture.home_team.name} vs {fixture.away_team.name}{venue_info}{referee_info}")
-            click.echo(
-                f"Status: {status_color}{fixture.status.long} ({status_display}){Style.RESET_ALL}")
-
-            # Score information
-            click.echo(f"\nScore: {Fore.BRIGHT}{fixture.score_display}{Style.RESET_ALL}")
+            # Header with match info and score
+            lines.extend((
+                f"\n{Fore.YELLOW}{Style.BRIGHT}{match_datetime}{Style.RESET_ALL}",
+                f"{fixture.home_team.name} vs {fixture.away_team.name}{venue_info}{referee_info}",
+                f"Status: {format_status(fixture.status)}",
+                f"\nScore: {Style.BRIGHT}{fixture.score_display}{Style.RESET_ALL}",
+            ))
 
             # Additional score details if available
             if fixture.score:
-                if fixture.score.halftime and fixture.score.halftime.get("home") is not None:
-                    home_ht = fixture.score.halftime.get("home", 0)
-                    away_ht = fixture.score.halftime.get("away", 0)
-                    click.echo(f"Halftime: {home_ht}-{away_ht}")
-
-                if fixture.score.fulltime and fixture.score.fulltime.get("home") is not None:
-                    home_ft = fixture.score.fulltime.get("home", 0)
-                    away_ft = fixture.score.fulltime.get("away", 0)
-                    click.echo(f"Fulltime: {home_ft}-{away_ft}")
-
-                if fixture.score.extratime and fixture.score.extratime.get("home") is not None:
-                    home_et = fixture.score.extratime.get("home", 0)
-                    away_et = fixture.score.extratime.get("away", 0)
-                    click.echo(f"Extra Time: {home_et}-{away_et}")
-
-                if fixture.score.penalty and fixture.score.penalty.get("home") is not None:
-                    home_pen = fixture.score.penalty.get("home", 0)
-                    away_pen = fixture.score.penalty.get("away", 0)
-                    click.echo(f"Penalties: {home_pen}-{away_pen}")
+                for attr, label in _SCORE_DETAILS:
+                    detail = getattr(fixture.score, attr)
+                    if detail and detail.get("home") is not None:
+                        lines.append(f"{label}: {detail['home']}-{detail.get('away', 0)}")
 
             # Add a separator line
-            click.echo(f"{'-'*50}")
\ No newline at end of file
+            lines.append(_FIXTURE_SEPARATOR)
+
+        return "\n".join(lines)
+
+
+def display_fixtures(fixtures, format):
+    """Helper function to display fixtures."""
+    text = render_fixtures(fixtures, format)
+    if text:
+        click.echo(text)
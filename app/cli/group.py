@@ -0,0 +1,73 @@
+"""
+Click group exposing every Sporty subcommand.
+
+The sporty console script dispatches through argparse in app.cli.cli; this
+group is kept for programmatic use (for example click's CliRunner) and
+resolves each subcommand lazily from the same registry.
+"""
+
+import click
+import importlib
+import logging
+
+from app.cli.cli import SUBCOMMANDS
+
+
+class LazyGroup(click.Group):
+    """
+    Click group that imports its subcommands only when they are invoked.
+
+    Each subcommand is registered as a "module.path:attribute" string so that
+    running one command (or just --help) does not pay the import cost of the
+    others and their service/API dependencies.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        """
+        Initialize the lazy group.
+
+        Args:
+            lazy_subcommands: Mapping of command name to "module:attribute"
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        """List eagerly registered and lazy subcommand names."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        """Return the named subcommand, importing it on first use."""
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_subcommands:
+            command = self._lazy_load(cmd_name)
+        return command
+
+    def _lazy_load(self, cmd_name):
+        """Import a lazy subcommand and register it on the group."""
+        import_path = self.lazy_subcommands[cmd_name]
+        module_name, attr_name = import_path.rsplit(":", 1)
+        command = getattr(importlib.import_module(module_name), attr_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy loading of {import_path} failed: not a click command"
+            )
+        # Register under the group's name so later lookups skip the import
+        self.add_command(command, name=cmd_name)
+        return command
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={name: path for name, (path, _) in SUBCOMMANDS.items()},
+)
+@click.option(
+    "--debug/--no-debug",
+    default=False,
+    help="Enable debug logging."
+)
+def cli(debug):
+    """Sporty CLI - Your sports companion app."""
+    # Set up logging based on debug flag
+    if debug:
+        logging.getLogger().setLevel(logging.DEBUG)
@@ -4,11 +4,19 @@ Football data models for the Sporty application.
 
 from dataclasses import dataclass, field
 import dataclasses
+import sys
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Union
 
+# Models read in the display loops are slotted on Python 3.10+, which drops
+# the per-instance __dict__ and makes their attribute reads cheaper
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Short status codes of fixtures that are in progress, breaks included
+LIVE_STATUSES = frozenset({"1H", "2H", "HT", "ET", "BT", "P", "LIVE"})
+
+
+@dataclass(frozen=True, **_SLOTS)
 class League:
     """
     Represents a football league.
@@ -114,7 +122,7 @@ class Player:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FixtureStatus:
     """
     Fixture status information.
@@ -131,11 +139,10 @@ class FixtureStatus:
     @property
     def is_live(self) -> bool:
         """Check if the match is currently live."""
-        live_statuses = ["1H", "2H", "HT", "ET", "BT", "P", "LIVE"]
-        return self.short in live_statuses
+        return self.short in LIVE_STATUSES
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FixtureScore:
     """
     Score information for a fixture.
@@ -152,7 +159,7 @@ class FixtureScore:
     penalty: Optional[Dict[str, int]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FixtureTeam:
     """
     Team information for a fixture.
@@ -171,7 +178,7 @@ class FixtureTeam:
     winner: Optional[bool] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Fixture:
     """
     Represents a football match fixture.
@@ -336,7 +343,7 @@ class TeamStanding:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FixtureEvent:
     """
     Represents an event that occurred during a match.
@@ -386,7 +393,7 @@ class FixtureEvent:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TeamStatistic:
     """
     Represents a single statistic for a team.
@@ -434,7 +441,7 @@ class FixtureStatistics:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LineupPlayer:
     """
     Represents a player in a lineup.
@@ -453,7 +460,7 @@ class LineupPlayer:
     grid: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TeamLineup:
     """
     Represents a team's lineup for a fixture.
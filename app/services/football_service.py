@@ -3,10 +3,11 @@ Football service for managing football data operations.
 """
 
 import logging
-from typing import List, Dict, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional, Union
 from datetime import datetime
 
-from app.api.client import FootballAPIClient
+from app.api.client import FootballAPIClient, MAX_CONCURRENT_REQUESTS
 from app.utils.api_utils import parse_response
 from app.utils.error_handlers import handle_api_error, APIError
 from app.models.football_data import (
@@ -121,6 +122,50 @@ class FootballService:
 
         return [Fixture.from_api(item) for item in fixtures_data]
 
+    def get_fixture(self, fixture_id: int) -> Optional[Fixture]:
+        """
+        Get information for a specific fixture by ID.
+
+        Args:
+            fixture_id: ID of the fixture
+
+        Returns:
+            Fixture object or None if fixture not found
+        """
+        response = self.client.get_fixture(fixture_id=fixture_id)
+        fixture_data = parse_response(response, error_handler=handle_api_error)
+
+        if not fixture_data:
+            return None
+
+        return Fixture.from_api(fixture_data[0])
+
+    def get_fixtures_by_ids(self, fixture_ids: List[int]) -> Dict[int, Fixture]:
+        """
+        Get several fixtures by ID with as few API requests as possible.
+
+        Duplicate IDs are requested once, and the remaining IDs are looked up
+        in batches that are fetched concurrently.
+
+        Args:
+            fixture_ids: IDs of the fixtures
+
+        Returns:
+            Dict mapping fixture IDs to Fixture objects; IDs the API does not
+            know are left out
+        """
+        unique_ids = list(dict.fromkeys(fixture_ids))
+        if not unique_ids:
+            return {}
+
+        fixtures: Dict[int, Fixture] = {}
+        for response in self.client.get_fixtures_by_ids(unique_ids):
+            for item in parse_response(response, error_handler=handle_api_error):
+                fixture = Fixture.from_api(item)
+                fixtures[fixture.id] = fixture
+
+        return fixtures
+
     def get_players(self, team_id: int, season: Optional[int] = None) -> List[Player]:
         """
         Get players information for a specific team and season.
@@ -140,8 +185,8 @@ class FootballService:
         players_data = parse_response(response, error_handler=handle_api_error)
 
         # Debug log to see the structure
-        logger.debug(
-            f"Players data structure: {players_data[:1] if players_data else []}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Players data structure: %s", players_data[:1])
 
         player_list = []
         for item in players_data:
@@ -287,26 +332,15 @@ class FootballService:
         # First, get all leagues
         leagues = self.get_leagues(country=country, season=season)
 
-        # Dictionary to store results
-        result: Dict[League, List[Fixture]] = {}
-
-        # For each league, get live matches
-        for league in leagues:
-            try:
-                live_matches = self.get_live_scores(
-                    league_id=league.id,
-                    timezone=timezone
-                )
-
-                # Only add leagues that have live matches
-                if live_matches:
-                    result[league] = live_matches
-
-            except Exception as e:
-                logger.error(
-                    f"Error getting live matches for league {league.id}: {e}")
-
-        return result
+        # Get live matches for every league concurrently
+        return self._collect_by_league(
+            leagues,
+            lambda league: self.get_live_scores(
+                league_id=league.id,
+                timezone=timezone
+            ),
+            "live matches"
+        )
 
     def get_matches(
         self,
@@ -409,27 +443,56 @@ class FootballService:
         # First, get all leagues
         leagues = self.get_leagues(country=country, season=season)
 
-        # Dictionary to store results
+        # Get matches for every league concurrently
+        return self._collect_by_league(
+            leagues,
+            lambda league: self.get_matches(
+                league_id=league.id,
+                season=season,
+                date=date,
+                timezone=timezone,
+                live=False
+            ),
+            "matches"
+        )
+
+    def _collect_by_league(
+        self,
+        leagues: List[League],
+        fetch: Callable[[League], List[Fixture]],
+        description: str
+    ) -> Dict[League, List[Fixture]]:
+        """
+        Fetch fixtures for several leagues concurrently.
+
+        Args:
+            leagues: Leagues to fetch fixtures for
+            fetch: Function returning the fixtures for one league
+            description: What is being fetched, for error messages
+
+        Returns:
+            Dict mapping leagues that have fixtures to their fixtures,
+            in the order the leagues were given
+        """
         result: Dict[League, List[Fixture]] = {}
+        if not leagues:
+            return result
 
-        # For each league, get matches
-        for league in leagues:
-            try:
-                matches = self.get_matches(
-                    league_id=league.id,
-                    season=season,
-                    date=date,
-                    timezone=timezone,
-                    live=False
-                )
+        max_workers = min(MAX_CONCURRENT_REQUESTS, len(leagues))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(league, executor.submit(fetch, league)) for league in leagues]
 
-                # Only add leagues that have matches
-                if matches:
-                    result[league] = matches
+            for league, future in futures:
+                try:
+                    fixtures = future.result()
 
-            except Exception as e:
-                logger.error(
-                    f"Error getting matches for league {league.id}: {e}")
+                    # Only add leagues that have matches
+                    if fixtures:
+                        result[league] = fixtures
+
+                except Exception as e:
+                    logger.error(
+                        f"Error getting {description} for league {league.id}: {e}")
 
         return result
 
@@ -510,20 +573,26 @@ class FootballService:
         Returns:
             MatchStatistics object containing events, team statistics, and lineups
         """
+        # The three endpoints are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            events_future = executor.submit(self.get_fixture_events, fixture_id)
+            statistics_future = executor.submit(self.get_fixture_statistics, fixture_id)
+            lineups_future = executor.submit(self.get_fixture_lineups, fixture_id)
+
         try:
-            events = self.get_fixture_events(fixture_id)
+            events = events_future.result()
         except Exception as e:
             logger.warning(f"Failed to get fixture events: {e}")
             events = []
 
         try:
-            team_statistics = self.get_fixture_statistics(fixture_id)
+            team_statistics = statistics_future.result()
         except Exception as e:
             logger.warning(f"Failed to get fixture statistics: {e}")
             team_statistics = {}
 
         try:
-            lineups = self.get_fixture_lineups(fixture_id)
+            lineups = lineups_future.result()
         except Exception as e:
             logger.warning(f"Failed to get fixture lineups: {e}")
             lineups = {}
@@ -744,11 +813,13 @@ class FootballService:
         if season is None:
             season = self.get_current_season()
 
-        # Get both yellow and red cards data
-        yellow_cards_data = self.get_top_yellow_cards(
-            league_id=league_id, season=season)
-        red_cards_data = self.get_top_red_cards(
+        # Get both yellow and red cards data in a single concurrent batch
+        yellow_response, red_response = self.client.get_top_cards(
             league_id=league_id, season=season)
+        yellow_cards_data = parse_response(
+            yellow_response, error_handler=handle_api_error)
+        red_cards_data = parse_response(
+            red_response, error_handler=handle_api_error)
 
         # Combine both datasets
         # Use a dictionary to track players we've seen to avoid duplicates
@@ -813,46 +884,33 @@ class FootballService:
         # Since API doesn't have a specific endpoint for top appearances,
         # we'll fetch all players and sort/filter them manually
         all_players = []
-        current_page = 1
         max_pages = 5  # Limit to reasonable number of pages to avoid excessive API calls
 
-        # Fetch players data from multiple pages if available
-        while current_page <= max_pages:
-            try:
-                logger.info(
-                    f"Fetching players data for league {league_id}, season {season}, page {current_page}")
-                response = self.client.get_league_players(
-                    league_id=league_id,
-                    season=season,
-                    page=current_page
-                )
+        # Fetch players data from multiple pages concurrently
+        logger.info(
+            f"Fetching players data for league {league_id}, season {season} (up to {max_pages} pages)")
+        responses = self.client.get_league_players_all_pages(
+            league_id=league_id,
+            season=season,
+            max_pages=max_pages
+        )
 
+        for response in responses:
+            try:
                 # Parse the response
                 players_data = parse_response(
                     response, error_handler=handle_api_error)
-
-                if not players_data:
-                    # No more data available
-                    break
-
-                # Add to our collection
-                all_players.extend(players_data)
-
-                # Get pagination info if available
-                pagination = response.get("paging", {})
-                total_pages = pagination.get("total", 1)
-
-                if current_page >= total_pages:
-                    # No more pages available
-                    break
-
-                # Move to next page
-                current_page += 1
-
             except APIError as e:
                 logger.error(f"Error fetching players data: {e}")
                 break
 
+            if not players_data:
+                # No more data available
+                break
+
+            # Add to our collection
+            all_players.extend(players_data)
+
         # Now sort the players by number of appearances in descending order
         # Filter out players missing statistics or games and compute appearance counts
         valid_players = []
@@ -0,0 +1,109 @@
+"""
+On-disk response caching for the Sporty application.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import orjson
+import tempfile
+import time
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default location for cached API responses (override with SPORTY_CACHE_DIR)
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sporty")
+
+
+class ResponseCache:
+    """File-backed TTL cache for API responses keyed by (endpoint, params)."""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory to store cached responses in
+        """
+        self.cache_dir = cache_dir or os.getenv("SPORTY_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.responses_dir = os.path.join(self.cache_dir, "responses")
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build a stable cache key for an endpoint and its query parameters.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters for the request
+
+        Returns:
+            Hex digest identifying the request
+        """
+        items = sorted((params or {}).items())
+        raw = json.dumps([endpoint, items], default=str, separators=(",", ":"))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Get the file path for a cache key."""
+        return os.path.join(self.responses_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached response if it exists and has not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached response or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+        if entry.get("expires", 0) < time.time():
+            return None
+
+        return entry.get("response")
+
+    def set(self, key: str, response: Dict[str, Any], ttl: int) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            key: Cache key
+            response: API response to store
+            ttl: Time to live in seconds
+        """
+        if ttl <= 0:
+            return
+
+        entry = {"expires": time.time() + ttl, "response": response}
+        try:
+            os.makedirs(self.responses_dir, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.responses_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(entry))
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"Failed to write response cache: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        try:
+            names = os.listdir(self.responses_dir)
+        except OSError:
+            return
+
+        for name in names:
+            try:
+                os.remove(os.path.join(self.responses_dir, name))
+            except OSError:
+                pass
@@ -8,6 +8,9 @@ from typing import Dict, Any, Optional, Callable
 
 logger = logging.getLogger(__name__)
 
+# Set once the global exception hook has been installed
+_error_handling_installed = False
+
 class APIError(Exception):
     """Exception raised for API-related errors."""
     
@@ -72,9 +75,17 @@ def setup_error_handling(exit_on_error: bool = False) -> None:
     """
     Set up global error handling.
     
+    Installing is a one-time operation; later calls return immediately so
+    the hook is never wrapped or replaced twice.
+
     Args:
         exit_on_error: Whether to exit the program on uncaught exceptions
     """
+    global _error_handling_installed
+    if _error_handling_installed:
+        return
+    _error_handling_installed = True
+
     def exception_handler(exctype, value, traceback):
         """Custom exception handler."""
         logger.error("Uncaught exception", exc_info=(exctype, value, traceback))
@@ -0,0 +1,149 @@
+"""
+Unit tests for the API client helpers.
+
+This module contains pytest-based tests for the response caching helpers,
+request batching and cached fixture filtering in the app.api.client module.
+"""
+
+import orjson
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.api.client import (
+    CACHE_TTLS,
+    FINISHED_FIXTURES_TTL,
+    LIVE_FIXTURES_TTL,
+    MAX_FIXTURE_IDS_PER_REQUEST,
+    FootballAPIClient,
+    _filter_fixtures_by_date,
+    _response_ttl,
+)
+from app.utils.cache import ResponseCache
+
+
+def _fixtures_response(*statuses):
+    """Build a fixtures response with one fixture per status."""
+    return {
+        "errors": [],
+        "response": [{"fixture": {"status": {"short": short}}} for short in statuses]
+    }
+
+
+@pytest.mark.parametrize("statuses,expected", [
+    (("FT",), FINISHED_FIXTURES_TTL),
+    (("FT", "AET", "PEN"), FINISHED_FIXTURES_TTL),
+    (("FT", "NS"), CACHE_TTLS["fixtures"]),
+    (("NS",), CACHE_TTLS["fixtures"]),
+    (("1H",), LIVE_FIXTURES_TTL),
+    (("FT", "HT"), LIVE_FIXTURES_TTL),
+])
+def test_response_ttl_for_fixtures(statuses, expected):
+    """Test that fixture listings are kept longer once finished and briefly while live."""
+    data = _fixtures_response(*statuses)
+
+    assert _response_ttl("fixtures", data, CACHE_TTLS["fixtures"]) == expected
+
+
+def test_response_ttl_other_endpoints():
+    """Test that other endpoints keep their configured lifetime."""
+    data = {"errors": [], "response": [{"team": {"id": 1}}]}
+
+    assert _response_ttl("fixtures/lineups", data, CACHE_TTLS["fixtures/lineups"]) == CACHE_TTLS["fixtures/lineups"]
+
+
+def test_response_ttl_unexpected_payload():
+    """Test that fixtures without status information use the default lifetime."""
+    data = {"errors": [], "response": [{"fixture": {}}]}
+
+    assert _response_ttl("fixtures", data, CACHE_TTLS["fixtures"]) == CACHE_TTLS["fixtures"]
+
+
+def test_get_fixtures_by_ids_batches_requests():
+    """Test that fixture IDs are split into batches the API accepts."""
+    client = FootballAPIClient(use_cache=False)
+    fixture_ids = list(range(1, MAX_FIXTURE_IDS_PER_REQUEST + 3))
+
+    with patch.object(client, "fetch_many", return_value=[]) as fetch_many:
+        client.get_fixtures_by_ids(fixture_ids)
+
+    specs = fetch_many.call_args[0][0]
+    assert [params["ids"] for _, params in specs] == [
+        "-".join(str(i) for i in range(1, MAX_FIXTURE_IDS_PER_REQUEST + 1)),
+        f"{MAX_FIXTURE_IDS_PER_REQUEST + 1}-{MAX_FIXTURE_IDS_PER_REQUEST + 2}",
+    ]
+
+
+def _dated_fixtures_response(*dates):
+    """Build a fixtures response with one fixture per kick-off date."""
+    return {
+        "errors": [],
+        "results": len(dates),
+        "response": [{"fixture": {"id": i, "date": f"{day}T15:00:00+00:00"}} for i, day in enumerate(dates)]
+    }
+
+
+@pytest.mark.parametrize("filters,expected", [
+    ({"date": "2023-08-19"}, ["2023-08-19"]),
+    ({"from_date": "2023-08-19"}, ["2023-08-19", "2023-08-26"]),
+    ({"to_date": "2023-08-19"}, ["2023-08-12", "2023-08-19"]),
+    ({"from_date": "2023-08-13", "to_date": "2023-08-25"}, ["2023-08-19"]),
+])
+def test_filter_fixtures_by_date(filters, expected):
+    """Test that only fixtures inside the requested dates are kept."""
+    data = _dated_fixtures_response("2023-08-12", "2023-08-19", "2023-08-26")
+
+    filtered = _filter_fixtures_by_date(data, **filters)
+
+    assert [item["fixture"]["date"][:10] for item in filtered["response"]] == expected
+    assert filtered["results"] == len(expected)
+
+
+def test_get_fixtures_by_date_uses_cached_season(tmp_path):
+    """Test that a cached season listing answers date queries without a request."""
+    client = FootballAPIClient()
+    client.cache = ResponseCache(cache_dir=str(tmp_path))
+    season = _dated_fixtures_response("2023-08-12", "2023-08-19")
+    client.cache.set(client.cache.make_key("fixtures", {"league": 39, "season": 2023}), season, ttl=60)
+
+    with patch.object(client, "_make_request") as make_request:
+        data = client.get_fixtures(league_id=39, season=2023, date="2023-08-19")
+
+    make_request.assert_not_called()
+    assert data["results"] == 1
+
+
+@pytest.mark.parametrize("fixture_status,expected", [
+    ("FT", CACHE_TTLS["fixtures/events"]),
+    ("2H", LIVE_FIXTURES_TTL),
+    (None, LIVE_FIXTURES_TTL),
+])
+def test_fixture_events_ttl_follows_fixture_status(tmp_path, fixture_status, expected):
+    """Test that events are only kept for their full lifetime once the match has finished."""
+    client = FootballAPIClient()
+    client.cache = ResponseCache(cache_dir=str(tmp_path))
+    if fixture_status:
+        client.cache.set(client.cache.make_key("fixtures", {"id": 7}), _fixtures_response(fixture_status), ttl=60)
+
+    response = MagicMock()
+    response.content = orjson.dumps({"errors": [], "response": [{"type": "Goal"}]})
+
+    with patch.object(client._session, "request", return_value=response), \
+            patch.object(client.cache, "set") as cache_set:
+        client.get_fixture_events(7)
+
+    assert cache_set.call_args[0][2] == expected
+
+
+def test_get_top_cards_fetches_both_lists_together():
+    """Test that yellow and red card leaders are requested in one concurrent batch."""
+    client = FootballAPIClient(use_cache=False)
+    yellow, red = {"response": ["yellow"]}, {"response": ["red"]}
+
+    with patch.object(client, "fetch_many", return_value=[yellow, red]) as fetch_many:
+        assert client.get_top_cards(league_id=39, season=2023) == (yellow, red)
+
+    params = {"league": 39, "season": 2023}
+    fetch_many.assert_called_once_with([
+        ("players/topyellowcards", params),
+        ("players/topredcards", params),
+    ])
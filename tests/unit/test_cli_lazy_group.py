@@ -0,0 +1,110 @@
+"""
+Unit tests for lazy subcommand loading.
+
+This module contains pytest-based tests for the LazyGroup class and the
+top-level cli group in the app.cli.group module.
+"""
+
+import click
+import pytest
+
+from app.cli.group import LazyGroup, cli
+
+
+def test_list_commands_includes_lazy_and_eager():
+    """Test that lazy and eagerly added commands are listed together."""
+    group = LazyGroup(
+        name="test",
+        lazy_subcommands={"squad": "app.cli.commands.squad_cmd:team_squad"}
+    )
+    group.add_command(click.Command(name="eager"))
+
+    assert group.list_commands(None) == ["eager", "squad"]
+
+
+def test_get_command_loads_and_registers():
+    """Test that a lazy command is imported on lookup and then cached."""
+    group = LazyGroup(
+        name="test",
+        lazy_subcommands={"squad": "app.cli.commands.squad_cmd:team_squad"}
+    )
+
+    command = group.get_command(None, "squad")
+
+    assert isinstance(command, click.Command)
+    assert group.commands["squad"] is command
+    assert group.get_command(None, "squad") is command
+
+
+def test_get_command_unknown_name():
+    """Test that an unknown command name resolves to None."""
+    group = LazyGroup(name="test", lazy_subcommands={})
+
+    assert group.get_command(None, "missing") is None
+
+
+def test_get_command_rejects_non_command():
+    """Test that a lazy path pointing at a non-command raises an error."""
+    group = LazyGroup(
+        name="test",
+        lazy_subcommands={"bad": "app.cli.cli:main"}
+    )
+
+    with pytest.raises(ValueError):
+        group.get_command(None, "bad")
+
+
+def test_cli_lists_all_commands():
+    """Test that every top-level subcommand is exposed by the cli group."""
+    assert cli.list_commands(None) == [
+        "history", "lineup", "live", "matches", "squad",
+        "standings", "stats", "team-stats", "top-performer",
+    ]
+
+
+def test_commands_package_is_lazy(monkeypatch):
+    """Test that importing the commands package imports no command modules."""
+    import importlib
+    import sys
+
+    for name in list(sys.modules):
+        if name == "app.cli.commands" or name.startswith("app.cli.commands."):
+            monkeypatch.delitem(sys.modules, name)
+
+    commands = importlib.import_module("app.cli.commands")
+
+    assert "app.cli.commands.standings_cmd" not in sys.modules
+    assert commands.team_squad.name == "squad"
+    assert "app.cli.commands.squad_cmd" in sys.modules
+    assert "app.cli.commands.standings_cmd" not in sys.modules
+
+
+def test_main_dispatches_to_requested_command(monkeypatch):
+    """Test that main() imports and runs only the named click command."""
+    import sys
+    from unittest.mock import patch
+
+    from app.cli import cli as cli_module
+
+    monkeypatch.setattr(sys, "argv", ["sporty", "squad", "42", "--season", "2023"])
+
+    with patch("app.cli.commands.squad_cmd.team_squad.main") as mock_main, \
+            patch("app.utils.error_handlers.setup_error_handling"):
+        cli_module.main()
+
+    mock_main.assert_called_once_with(args=["42", "--season", "2023"], prog_name="sporty squad")
+
+
+def test_registry_matches_click_commands():
+    """Test that the static command registry mirrors the real click commands."""
+    import importlib
+
+    from app.cli.cli import SUBCOMMANDS, STATIC_HELP
+
+    for name, (import_path, short_help) in SUBCOMMANDS.items():
+        module_name, attr_name = import_path.rsplit(":", 1)
+        command = getattr(importlib.import_module(module_name), attr_name)
+
+        assert isinstance(command, click.Command)
+        assert command.help.strip().splitlines()[0] == short_help
+        assert f"  {name:<13}  {short_help}" in STATIC_HELP
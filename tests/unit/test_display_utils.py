@@ -0,0 +1,209 @@
+"""
+Unit tests for the CLI display helpers.
+
+This module contains pytest-based tests for the helpers in the
+app.cli.commands.utils module.
+"""
+
+import pytest
+from colorama import Fore, Style
+
+from app.cli.commands.utils import (
+    _center_colored,
+    _grid_cell,
+    _parse_formation,
+    _status_cell,
+    classify_position,
+    display_fixtures,
+    display_visual_formation,
+    format_status,
+    get_position_color,
+    render_visual_formation,
+)
+from app.models.football_data import Fixture, FixtureStatus, LineupPlayer, TeamLineup
+
+
+@pytest.mark.parametrize("short,elapsed,expected", [
+    ("1H", 23, (Fore.GREEN, "1H 23'")),
+    ("HT", 45, (Fore.YELLOW, "HT 45'")),
+    ("FT", 90, (Fore.BLUE, "FT")),
+    ("PST", None, (Fore.RED, "PST")),
+    ("NS", None, (Fore.CYAN, "NS")),
+    ("AWD", None, (Fore.WHITE, "AWD")),
+])
+def test_status_cell(short, elapsed, expected):
+    """Test status colours and elapsed-time display for each status group."""
+    status = FixtureStatus(long="Status", short=short, elapsed=elapsed)
+
+    assert _status_cell(status) == expected
+
+
+def test_format_status():
+    """Test that the long status is shown with its coloured short form."""
+    status = FixtureStatus(long="Second Half", short="2H", elapsed=67)
+
+    assert format_status(status) == f"{Fore.GREEN}Second Half (2H 67'){Style.RESET_ALL}"
+
+
+@pytest.mark.parametrize("position,expected", [
+    ("Goalkeeper", Fore.YELLOW),
+    ("GK", Fore.YELLOW),
+    ("Defender", Fore.BLUE),
+    ("RWB", Fore.BLUE),
+    ("Attacking Midfielder", Fore.GREEN),
+    ("cam", Fore.GREEN),
+    ("Striker", Fore.RED),
+    ("ST", Fore.RED),
+    ("Coach", ""),
+    (None, ""),
+])
+def test_get_position_color(position, expected):
+    """Test position colours for abbreviations and full position names."""
+    assert get_position_color(position) == expected
+
+
+@pytest.mark.parametrize("position,expected", [
+    ("G", "goalkeeper"),
+    ("D", "defender"),
+    ("M", "midfielder"),
+    ("F", "forward"),
+    ("CDM", "midfielder"),
+    ("Attacker", "forward"),
+    ("Centre-Back Defender", "defender"),
+    ("Coach", None),
+    ("", None),
+])
+def test_classify_position(position, expected):
+    """Test that position codes and names map to their line of the team."""
+    assert classify_position(position) == expected
+
+
+def test_center_colored_pads_on_visible_text():
+    """Test that colour codes do not count towards the centred width."""
+    line = _center_colored("Defenders", 21, Fore.BLUE)
+
+    assert line == f"      {Fore.BLUE}Defenders{Style.RESET_ALL}      "
+
+
+def test_center_colored_wider_than_width():
+    """Test that text wider than the width is left unpadded."""
+    assert _center_colored("Goalkeeper", 4, "") == f"Goalkeeper{Style.RESET_ALL}"
+
+
+@pytest.fixture
+def lineup():
+    """Create a 4-4-2 lineup with positions as abbreviations and full names."""
+    starters = [LineupPlayer(id=1, name="Keeper", number=1, position="Goalkeeper")]
+    starters += [LineupPlayer(id=10 + i, name=f"Back {i}", position="CB") for i in range(4)]
+    starters += [LineupPlayer(id=20 + i, name=f"Mid {i}", position="Midfielder") for i in range(4)]
+    starters += [LineupPlayer(id=30 + i, name=f"Striker {i}", position="ST") for i in range(2)]
+    return TeamLineup(team_id=1, team_name="Team", formation="4-4-2", starters=starters,
+                      substitutes=[], coach="Coach")
+
+
+def test_display_visual_formation(lineup, capsys):
+    """Test that every formation line is rendered with its players."""
+    display_visual_formation(lineup)
+    output = capsys.readouterr().out
+
+    for text in ("(GK)", "Keeper", "Defenders", "Back 3", "Midfielders", "Mid 3", "Forwards", "Striker 1"):
+        assert text in output
+
+
+def test_render_visual_formation_multiple_midfield_rows():
+    """Test that players sharing a position code across rows are each drawn once."""
+    starters = [LineupPlayer(id=1, name="Keeper", number=1, position="G", grid="1:1")]
+    starters += [LineupPlayer(id=2 + i, name=f"Ars{2 + i}", position="D", grid=f"2:{i + 1}") for i in range(4)]
+    starters += [LineupPlayer(id=6, name="Ars6", position="M", grid="3:1"),
+                 LineupPlayer(id=7, name="Ars7", position="M", grid="3:2")]
+    starters += [LineupPlayer(id=8 + i, name=f"Ars{8 + i}", position="M", grid=f"4:{i + 1}") for i in range(3)]
+    starters += [LineupPlayer(id=11, name="Ars11", position="F", grid="5:1")]
+    lineup = TeamLineup(team_id=1, team_name="Team", formation="4-2-3-1", starters=starters,
+                        substitutes=[], coach="Coach")
+
+    output = render_visual_formation(lineup)
+
+    assert "Keeper" in output
+    for player in starters[1:]:
+        assert output.count(f"{player.name} ") == 1
+
+
+def test_render_visual_formation_places_players_by_grid_row():
+    """Test that the grid row, not the position code, decides a player's row."""
+    starters = [LineupPlayer(id=1, name="Keeper", number=1, position="G", grid="1:1")]
+    starters += [LineupPlayer(id=2 + i, name=f"Back{i}", position="D", grid=f"2:{i + 1}") for i in range(4)]
+    starters += [LineupPlayer(id=6 + i, name=f"Holder{i}", position="M", grid=f"3:{i + 1}") for i in range(2)]
+    starters += [LineupPlayer(id=8, name="Winger", position="F", grid="4:1"),
+                 LineupPlayer(id=9, name="Playmaker", position="M", grid="4:2"),
+                 LineupPlayer(id=10, name="Inverted", position="F", grid="4:3"),
+                 LineupPlayer(id=11, name="Striker", position="F", grid="5:1")]
+    lineup = TeamLineup(team_id=1, team_name="Team", formation="4-2-3-1", starters=starters,
+                        substitutes=[], coach="Coach")
+
+    rows = render_visual_formation(lineup).splitlines()
+    winger_row = next(i for i, row in enumerate(rows) if "Winger" in row)
+
+    assert "Playmaker" in rows[winger_row] and "Inverted" in rows[winger_row]
+    assert "Striker" not in rows[winger_row]
+
+
+@pytest.mark.parametrize("grid,expected", [
+    ("2:3", (2, 3)),
+    ("1:1", (1, 1)),
+    (None, None),
+    ("", None),
+    ("2-3", None),
+])
+def test_grid_cell(grid, expected):
+    """Test that grid positions are parsed into (row, column)."""
+    assert _grid_cell(grid) == expected
+
+
+def test_display_visual_formation_bad_formation(lineup, capsys):
+    """Test that an unparseable formation is reported instead of raising."""
+    lineup.formation = "4-x-2"
+    display_visual_formation(lineup)
+
+    assert "unrecognised formation '4-x-2'" in capsys.readouterr().out
+
+
+def test_render_visual_formation_without_formation(lineup):
+    """Test that a lineup without a formation renders nothing."""
+    lineup.formation = ""
+
+    assert render_visual_formation(lineup) == ""
+
+
+@pytest.mark.parametrize("formation,expected", [
+    ("4-3-3", ((4, 3, 3), (0, 1, 2))),
+    ("4-2-3-1", ((4, 2, 3, 1), (0, 1, 1, 2))),
+    ("10", ((10,), (0,))),
+])
+def test_parse_formation(formation, expected):
+    """Test that formation rows are tagged defenders, midfielders, forwards."""
+    assert _parse_formation(formation) == expected
+
+
+def test_display_fixtures_detailed(capsys):
+    """Test that the detailed format lists every fixture with its score."""
+    fixtures = [
+        Fixture.from_api({
+            "fixture": {
+                "id": fixture_id,
+                "date": "2023-08-12T14:00:00+00:00",
+                "status": {"long": "Match Finished", "short": "FT", "elapsed": 90}
+            },
+            "teams": {"home": {"id": 42, "name": home}, "away": {"id": 65, "name": "Away"}},
+            "goals": {"home": 2, "away": 1},
+            "score": {"halftime": {"home": 1, "away": 0}}
+        })
+        for fixture_id, home in ((1, "Arsenal"), (2, "Chelsea"))
+    ]
+
+    display_fixtures(fixtures, "detailed")
+    output = capsys.readouterr().out
+
+    assert "Arsenal vs Away" in output
+    assert "Chelsea vs Away" in output
+    assert "Halftime: 1-0" in output
+    assert output.count("-" * 50) == 2
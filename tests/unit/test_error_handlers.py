@@ -0,0 +1,23 @@
+"""
+Unit tests for the error handling utilities.
+
+This module contains pytest-based tests for the setup_error_handling function
+in the app.utils.error_handlers module.
+"""
+
+import sys
+
+from app.utils import error_handlers
+
+
+def test_setup_error_handling_installs_once(monkeypatch):
+    """Test that repeated setup keeps the first installed exception hook."""
+    monkeypatch.setattr(error_handlers, "_error_handling_installed", False)
+    monkeypatch.setattr(sys, "excepthook", sys.__excepthook__)
+
+    error_handlers.setup_error_handling()
+    first_hook = sys.excepthook
+    error_handlers.setup_error_handling()
+
+    assert first_hook is not sys.__excepthook__
+    assert sys.excepthook is first_hook
@@ -0,0 +1,91 @@
+"""
+Unit tests for the football service.
+
+This module contains pytest-based tests for the FootballService class in the
+app.services.football_service module.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from app.api.client import FootballAPIClient
+from app.services.football_service import FootballService
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock FootballAPIClient for testing."""
+    with patch('app.services.football_service.FootballAPIClient') as MockClient:
+        client_instance = MagicMock(spec=FootballAPIClient)
+        MockClient.return_value = client_instance
+        yield client_instance
+
+
+def _fixture_item(fixture_id):
+    """Build a minimal fixtures API item."""
+    return {
+        "fixture": {
+            "id": fixture_id,
+            "date": "2023-08-12T14:00:00+00:00",
+            "status": {"long": "Match Finished", "short": "FT", "elapsed": 90}
+        },
+        "league": {"id": 39, "name": "Premier League"},
+        "teams": {"home": {"id": 42, "name": "Arsenal"}, "away": {"id": 65, "name": "Nottingham Forest"}},
+        "goals": {"home": 2, "away": 1},
+        "score": {}
+    }
+
+
+def _fixtures_response(*fixture_ids):
+    """Build a fixtures API response for the given IDs."""
+    return {
+        "errors": [],
+        "results": len(fixture_ids),
+        "response": [_fixture_item(fixture_id) for fixture_id in fixture_ids]
+    }
+
+
+def test_get_fixtures_by_ids(mock_client):
+    """Test that fixtures from every batch are returned keyed by ID."""
+    mock_client.get_fixtures_by_ids.return_value = [
+        _fixtures_response(1, 2),
+        _fixtures_response(3)
+    ]
+
+    fixtures = FootballService().get_fixtures_by_ids([1, 2, 3])
+
+    assert sorted(fixtures) == [1, 2, 3]
+    assert fixtures[3].home_team.name == "Arsenal"
+
+
+def test_get_fixtures_by_ids_requests_each_id_once(mock_client):
+    """Test that duplicate IDs are only requested once."""
+    mock_client.get_fixtures_by_ids.return_value = [_fixtures_response(7, 8)]
+
+    FootballService().get_fixtures_by_ids([7, 8, 7])
+
+    mock_client.get_fixtures_by_ids.assert_called_once_with([7, 8])
+
+
+def test_get_fixtures_by_ids_empty(mock_client):
+    """Test that no request is made without fixture IDs."""
+    assert FootballService().get_fixtures_by_ids([]) == {}
+    mock_client.get_fixtures_by_ids.assert_not_called()
+
+
+def test_get_fixture(mock_client):
+    """Test that a single fixture is looked up by ID."""
+    mock_client.get_fixture.return_value = _fixtures_response(5)
+
+    fixture = FootballService().get_fixture(5)
+
+    mock_client.get_fixture.assert_called_once_with(fixture_id=5)
+    assert fixture.id == 5
+    assert fixture.status.short == "FT"
+
+
+def test_get_fixture_not_found(mock_client):
+    """Test that an unknown fixture ID returns None."""
+    mock_client.get_fixture.return_value = {"errors": [], "results": 0, "response": []}
+
+    assert FootballService().get_fixture(404) is None
@@ -0,0 +1,67 @@
+"""
+Unit tests for the lineup command.
+
+This module contains pytest-based tests for the fixture_lineup function in the
+app.cli.commands.lineup_cmd module.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+from click.testing import CliRunner
+
+from app.cli.commands.lineup_cmd import fixture_lineup
+from app.models.football_data import LineupPlayer, TeamLineup
+from app.services.football_service import FootballService
+
+
+@pytest.fixture
+def mock_service():
+    """Create a mock FootballService for testing."""
+    with patch('app.cli.commands.lineup_cmd.FootballService') as MockService:
+        service_instance = MagicMock(spec=FootballService)
+        MockService.return_value = service_instance
+        yield service_instance
+
+
+@pytest.fixture
+def cli_runner():
+    """Create a Click CLI runner for testing CLI commands."""
+    return CliRunner()
+
+
+@pytest.fixture
+def sample_lineups():
+    """Create sample lineups for both teams of a fixture."""
+    return {
+        42: TeamLineup(
+            team_id=42,
+            team_name="Arsenal",
+            formation="4-3-3",
+            starters=[LineupPlayer(id=1, name="David Raya", number=22, position="G", grid="1:1")],
+            substitutes=[],
+            coach="Mikel Arteta"
+        ),
+        65: TeamLineup(
+            team_id=65,
+            team_name="Nottingham Forest",
+            formation="4-2-3-1",
+            starters=[LineupPlayer(id=2, name="Matt Turner", number=1, position="G", grid="1:1")],
+            substitutes=[],
+            coach="Steve Cooper"
+        ),
+    }
+
+
+@pytest.mark.parametrize("error", [KeyError("fixture"), TypeError("bad payload")])
+def test_lineups_shown_when_fixture_lookup_fails(mock_service, cli_runner, sample_lineups, error):
+    """Test that the lineups are still rendered when the fixture lookup fails."""
+    mock_service.get_fixture_lineups.return_value = sample_lineups
+    mock_service.get_fixture.side_effect = error
+
+    result = cli_runner.invoke(fixture_lineup, ["1035037", "--no-visual"])
+
+    assert result.exit_code == 0
+    assert "Error:" not in result.output
+    assert "Arsenal" in result.output
+    assert "Nottingham Forest" in result.output
+    assert "Matt Turner" in result.output
@@ -0,0 +1,87 @@
+"""
+Unit tests for the on-disk response cache.
+
+This module contains pytest-based tests for the ResponseCache class in the
+app.utils.cache module.
+"""
+
+import time
+
+import pytest
+
+from app.utils.cache import ResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a ResponseCache rooted in a temporary directory."""
+    return ResponseCache(cache_dir=str(tmp_path))
+
+
+@pytest.fixture
+def sample_response():
+    """Create a sample API response for testing."""
+    return {
+        "get": "leagues",
+        "errors": [],
+        "results": 1,
+        "response": [{"league": {"id": 39, "name": "Premier League"}}]
+    }
+
+
+def test_make_key_ignores_param_order():
+    """Test that the cache key does not depend on parameter order."""
+    key_a = ResponseCache.make_key("standings", {"league": 39, "season": 2023})
+    key_b = ResponseCache.make_key("standings", {"season": 2023, "league": 39})
+
+    assert key_a == key_b
+
+
+def test_make_key_distinguishes_endpoints_and_params():
+    """Test that different requests map to different cache keys."""
+    base = ResponseCache.make_key("standings", {"league": 39})
+
+    assert base != ResponseCache.make_key("leagues", {"league": 39})
+    assert base != ResponseCache.make_key("standings", {"league": 140})
+    assert base != ResponseCache.make_key("standings")
+
+
+def test_set_and_get_round_trip(cache, sample_response):
+    """Test that a stored response is returned on a cache hit."""
+    key = cache.make_key("leagues", {"season": 2023})
+    cache.set(key, sample_response, ttl=60)
+
+    assert cache.get(key) == sample_response
+
+
+def test_get_missing_key(cache):
+    """Test that a missing entry is reported as a miss."""
+    assert cache.get(cache.make_key("leagues")) is None
+
+
+def test_expired_entry_is_a_miss(cache, sample_response, monkeypatch):
+    """Test that entries past their TTL are not returned."""
+    key = cache.make_key("leagues")
+    cache.set(key, sample_response, ttl=60)
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+
+    assert cache.get(key) is None
+
+
+def test_zero_ttl_is_not_stored(cache, sample_response):
+    """Test that a non-positive TTL disables caching for the entry."""
+    key = cache.make_key("fixtures", {"live": "all"})
+    cache.set(key, sample_response, ttl=0)
+
+    assert cache.get(key) is None
+
+
+def test_clear(cache, sample_response):
+    """Test that clear removes all cached entries."""
+    key = cache.make_key("leagues")
+    cache.set(key, sample_response, ttl=60)
+    cache.clear()
+
+    assert cache.get(key) is None
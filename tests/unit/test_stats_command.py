@@ -0,0 +1,92 @@
+"""
+Unit tests for the stats command and its helpers.
+
+This module contains pytest-based tests for the fixture_statistics command and
+its lineup table helpers in the app.cli.commands.stats_cmd module.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+from click.testing import CliRunner
+
+from app.cli.commands.stats_cmd import _player_cells, _side_by_side_table, fixture_statistics
+from app.models.football_data import (
+    FixtureEvent, FixtureStatistics, LineupPlayer, MatchStatistics, TeamStatistic
+)
+from app.services.football_service import FootballService
+
+
+@pytest.fixture
+def mock_service():
+    """Create a mock FootballService for testing."""
+    with patch('app.cli.commands.stats_cmd.FootballService') as MockService:
+        service_instance = MagicMock(spec=FootballService)
+        MockService.return_value = service_instance
+        yield service_instance
+
+
+def test_player_cells():
+    """Test the cells shown for a lineup player, with and without a grid."""
+    player = LineupPlayer(id=1, name="Bukayo Saka", number=7, position="F", grid="4:3")
+
+    assert _player_cells(player) == ["7", "Bukayo Saka", "F"]
+    assert _player_cells(player, grid=True) == ["7", "Bukayo Saka", "F", "4:3"]
+    assert _player_cells(None, grid=True) == ["", "", "", ""]
+
+
+def test_side_by_side_table_pads_shorter_team():
+    """Test that both teams share one table, padding the shorter list."""
+    home = [
+        LineupPlayer(id=1, name="Home One", number=1, position="G"),
+        LineupPlayer(id=2, name="Home Two", number=2, position="D"),
+    ]
+    away = [LineupPlayer(id=3, name="Away One", number=1, position="G")]
+
+    table = _side_by_side_table(home, away, ["Home FC", "Away FC"])
+    rows = table.splitlines()
+
+    assert "Home FC" in rows[0] and "Away FC" in rows[0]
+    assert "Home One" in rows[2] and "Away One" in rows[2]
+    assert "Home Two" in rows[3] and "Away" not in rows[3]
+
+
+def test_statistics_shown_when_fixture_lookup_fails(mock_service):
+    """Test that the statistics are still rendered when the fixture lookup fails."""
+    mock_service.get_fixture.side_effect = KeyError("fixture")
+    mock_service.get_match_statistics.return_value = MatchStatistics(
+        events=[],
+        team_statistics={
+            42: FixtureStatistics(team_id=42, team_name="Arsenal", statistics=[TeamStatistic(type="Shots on Goal", value=6)])
+        },
+        lineups={}
+    )
+
+    result = CliRunner().invoke(fixture_statistics, ["1035037"])
+
+    assert result.exit_code == 0
+    assert "Error:" not in result.output
+    assert "details unavailable" in result.output
+    assert "Shots on Goal" in result.output
+
+
+def test_events_without_time_are_listed_last(mock_service):
+    """Test that an event with a null elapsed time does not break sorting."""
+    mock_service.get_fixture.return_value = None
+    mock_service.get_match_statistics.return_value = MatchStatistics(
+        events=[
+            FixtureEvent.from_api({"time": {"elapsed": 30}, "team": {"id": 42, "name": "Arsenal"},
+                                   "player": {"id": 7, "name": "Bukayo Saka"}, "type": "Goal", "detail": "Normal Goal"}),
+            FixtureEvent.from_api({"time": {"elapsed": None}, "team": {"id": 42, "name": "Arsenal"},
+                                   "player": {"id": 9, "name": "Gabriel Jesus"}, "type": "Var", "detail": "Goal cancelled"}),
+            FixtureEvent.from_api({"time": {"elapsed": 12}, "team": {"id": 42, "name": "Arsenal"},
+                                   "player": {"id": 8, "name": "Martin Odegaard"}, "type": "Goal", "detail": "Normal Goal"}),
+        ],
+        team_statistics={},
+        lineups={}
+    )
+
+    result = CliRunner().invoke(fixture_statistics, ["1035037"])
+
+    assert result.exit_code == 0
+    assert "Error:" not in result.output
+    assert result.output.index("Martin Odegaard") < result.output.index("Bukayo Saka")